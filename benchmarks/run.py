@@ -0,0 +1,222 @@
+"""
+Benchmark suite for all components and the RenderHelper.
+
+Every scenario reports the operations per second, the template loads per operation and the peak of allocated memory
+per operation, measured with tracemalloc. The results are compared against a stored baseline.
+
+Run it from the project root::
+
+    python -m benchmarks.run                    # run all scenarios and compare them against the baseline
+    python -m benchmarks.run -k RenderHelper    # run only scenarios which contain 'RenderHelper'
+    python -m benchmarks.run --save-baseline    # store the results as new baseline
+"""
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "tests.app.settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.template.engine import Engine  # noqa: E402
+from django_bootstrap_swt.components import Tooltip, TooltipSurroundedComponent, ProgressBar, Badge, Link, Modal, \
+    Accordion, LinkButton, Button, ButtonGroup, Dropdown, ListGroupItem, ListGroup, Card, CardBody, CardFooter, \
+    CardHeader, Tag, Alert, ModalHeader, ModalBody, ModalFooter, DefaultHeaderRow  # noqa: E402
+from django_bootstrap_swt.enums import ButtonColorEnum, ButtonSizeEnum, BadgeColorEnum, AlertEnum, \
+    TooltipPlacementEnum, ProgressColorEnum, BackgroundColorEnum, TextColorEnum  # noqa: E402
+from django_bootstrap_swt.utils import RenderHelper  # noqa: E402
+from tests.test_components import BOOTSTRAP_COMPONENT_LIST  # noqa: E402
+
+BASELINE_PATH = Path(__file__).with_name('baseline.json')
+# a scenario is reported as regression if it is slower than this factor compared to the baseline
+REGRESSION_FACTOR = 0.8
+LIST_SIZES = (10, 1000, 100000)
+
+
+def component_scenarios() -> dict:
+    """:returns a dict with the component class as key and a function which builds and renders it as value"""
+    return {
+        Tag: lambda: Tag(tag='i', attrs={'class': ['fas', 'fa-edit']}).render(),
+        Tooltip: lambda: Tooltip(title='nice tooltip', surrounded_component='nice component',
+                                 placement=TooltipPlacementEnum.TOP).render(),
+        TooltipSurroundedComponent: lambda: TooltipSurroundedComponent(tag='span', content='nice component',
+                                                                       tooltip='nice tooltip').render(),
+        Alert: lambda: Alert(msg='nice alert', alert_type=AlertEnum.SUCCESS).render(),
+        ProgressBar: lambda: ProgressBar(progress=20, color=ProgressColorEnum.SUCCESS).render(),
+        Badge: lambda: Badge(content='1234', pill=True, color=BadgeColorEnum.PRIMARY, tooltip='nice tooltip').render(),
+        Link: lambda: Link(url='http://example.com/?page=1', content='nice link', color=TextColorEnum.PRIMARY,
+                           tooltip='nice tooltip').render(),
+        LinkButton: lambda: LinkButton(url='http://example.com/edit/1', content='<i class="fas fa-edit"></i>',
+                                       color=ButtonColorEnum.WARNING, size=ButtonSizeEnum.SMALL,
+                                       tooltip='Edit <strong>order 1</strong>').render(),
+        Button: lambda: Button(content='nice button', color=ButtonColorEnum.INFO, size=ButtonSizeEnum.SMALL,
+                               tooltip='nice tooltip').render(),
+        ButtonGroup: lambda: ButtonGroup(aria_label='actions',
+                                         buttons=[LinkButton(url=f'/edit/{i}', content='edit',
+                                                             color=ButtonColorEnum.INFO) for i in range(5)]).render(),
+        Dropdown: lambda: Dropdown(btn_value='nice dropdown', header='nice header',
+                                   items=[Link(url=f'/item/{i}', content=f'item {i}') for i in range(5)]).render(),
+        ModalHeader: lambda: ModalHeader(content='nice header').render(),
+        ModalBody: lambda: ModalBody(content='nice body').render(),
+        ModalFooter: lambda: ModalFooter(content='nice footer').render(),
+        Modal: lambda: Modal(btn_content='nice button', header='nice header', body='nice body',
+                             footer='nice footer', btn_tooltip='nice tooltip').render(),
+        CardHeader: lambda: CardHeader(content='nice header', bg_color=BackgroundColorEnum.LIGHT).render(),
+        CardBody: lambda: CardBody(content='nice body', fetch_url='http://example.com').render(),
+        CardFooter: lambda: CardFooter(content='nice footer').render(),
+        Card: lambda: Card(header=CardHeader(content='nice header'), body=CardBody(content='nice body'),
+                           footer=CardFooter(content='nice footer')).render(),
+        Accordion: lambda: Accordion(btn_value='nice button', content='nice body',
+                                     header_right_content='right').render(),
+        DefaultHeaderRow: lambda: DefaultHeaderRow(content_left='left', content_center='center',
+                                                   content_right='right').render(),
+        ListGroupItem: lambda: ListGroupItem(content='nice item').render(),
+        ListGroup: lambda: ListGroup(items=[ListGroupItem(content=f'item {i}') for i in range(10)]).render(),
+    }
+
+
+def nested_scenario() -> str:
+    """Accordion inside Card inside ListGroup"""
+    items = [ListGroupItem(content=Card(body=CardBody(content=Accordion(btn_value=f'accordion {i}',
+                                                                        fetch_url=f'/details/{i}'))))
+             for i in range(10)]
+    return ListGroup(items=items).render()
+
+
+def render_list_scenario(size: int, update_url_qs: dict = None, update_attrs: dict = None):
+    """:returns a function which renders a prepared list of items with the RenderHelper"""
+    render_helper = RenderHelper(user_permissions=['can_edit'], update_url_qs=update_url_qs,
+                                 update_attrs=update_attrs)
+    items = []
+    for i in range(size):
+        items.append(LinkButton(url=f'http://example.com/edit/{i}?page=1', content='edit',
+                                color=ButtonColorEnum.WARNING, needs_perm='can_edit'))
+        items.append(LinkButton(url=f'http://example.com/delete/{i}', content='delete',
+                                color=ButtonColorEnum.DANGER, needs_perm='can_delete'))
+    return lambda: render_helper.render_list_coherent(items=items)
+
+
+def scenarios() -> dict:
+    """:returns a dict with the scenario name as key and a function which builds the operation to measure as value"""
+    result = {}
+    for component_class, func in component_scenarios().items():
+        result[f'component.{component_class.__name__}'] = lambda func=func: func
+    result['nested.ListGroup>Card>Accordion'] = lambda: nested_scenario
+    for size in LIST_SIZES:
+        for variant, kwargs in (('plain', {}),
+                                ('update_url_qs', {'update_url_qs': {'tab': 'details'}}),
+                                ('update_attrs', {'update_attrs': {'class': ['btn-sm']}}),
+                                ('update_url_qs+update_attrs', {'update_url_qs': {'tab': 'details'},
+                                                                'update_attrs': {'class': ['btn-sm']}})):
+            result[f'RenderHelper.render_list_coherent[{size}].{variant}'] = \
+                lambda size=size, kwargs=kwargs: render_list_scenario(size, **kwargs)
+    return result
+
+
+class TemplateLoadCounter:
+    """
+    Counts the template lookups of all django template engines while it is active.
+    """
+    def __init__(self):
+        self.count = 0
+        self._find_template = None
+
+    def __enter__(self):
+        self._find_template = Engine.find_template
+        counter = self
+
+        def find_template(engine, *args, **kwargs):
+            counter.count += 1
+            return counter._find_template(engine, *args, **kwargs)
+
+        Engine.find_template = find_template
+        return self
+
+    def __exit__(self, *exc_info):
+        Engine.find_template = self._find_template
+
+
+def measure(operation, min_time: float) -> dict:
+    """
+    Measures the given operation.
+
+    :param operation: the function to measure
+    :param min_time: the minimum time in seconds to repeat the operation for the ops/sec measurement
+    :return: a dict with ops_per_sec, template_loads and peak_bytes per operation
+    """
+    operation()  # warm up template and translation caches
+
+    iterations = 0
+    start = time.perf_counter()
+    elapsed = 0.0
+    while elapsed < min_time or iterations == 0:
+        operation()
+        iterations += 1
+        elapsed = time.perf_counter() - start
+
+    with TemplateLoadCounter() as counter:
+        tracemalloc.start()
+        operation()
+        peak_bytes = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    return {'ops_per_sec': iterations / elapsed,
+            'template_loads': counter.count,
+            'peak_bytes': peak_bytes}
+
+
+def format_comparison(result: dict, baseline: dict) -> str:
+    if not baseline:
+        return 'no baseline'
+    factor = result['ops_per_sec'] / baseline['ops_per_sec']
+    comparison = f"{(factor - 1) * 100:+7.1f}% ops/sec"
+    if result['template_loads'] != baseline['template_loads']:
+        comparison += f", templates {baseline['template_loads']} -> {result['template_loads']}"
+    if factor < REGRESSION_FACTOR:
+        comparison += ' REGRESSION'
+    return comparison
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('-k', dest='keyword', default='', help='only run scenarios which contain this keyword')
+    parser.add_argument('--min-time', type=float, default=0.5,
+                        help='minimum time in seconds to repeat an operation for the ops/sec measurement')
+    parser.add_argument('--baseline', type=Path, default=BASELINE_PATH, help='path of the baseline json file')
+    parser.add_argument('--save-baseline', action='store_true', help='store the results as new baseline')
+    parser.add_argument('--fail-on-regression', action='store_true',
+                        help='exit with status 1 if a scenario is slower than the baseline')
+    args = parser.parse_args(argv)
+
+    uncovered = set(BOOTSTRAP_COMPONENT_LIST) - set(component_scenarios())
+    if uncovered:
+        parser.error(f"no benchmark for the components {sorted(cls.__name__ for cls in uncovered)}")
+
+    baseline = json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+    results = {}
+    regression = False
+    print(f"{'scenario':<66} {'ops/sec':>12} {'templates':>10} {'peak KiB':>10}  baseline")
+    for name, build_operation in scenarios().items():
+        if args.keyword not in name:
+            continue
+        result = measure(build_operation(), min_time=args.min_time)
+        results[name] = result
+        comparison = format_comparison(result, baseline.get(name))
+        regression = regression or comparison.endswith('REGRESSION')
+        print(f"{name:<66} {result['ops_per_sec']:>12.2f} {result['template_loads']:>10} "
+              f"{result['peak_bytes'] / 1024:>10.1f}  {comparison}", flush=True)
+
+    if args.save_baseline:
+        baseline.update(results)
+        args.baseline.write_text(json.dumps(baseline, indent=2, sort_keys=True) + '\n')
+    return 1 if regression and args.fail_on_regression else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,89 @@
+"""
+Scaling benchmark for composite components.
+
+Renders a ListGroup, a ButtonGroup, a Card and RenderHelper.render_list_coherent() with a growing amount of items and
+checks that the time per item stays constant, which means the rendering scales linear with the item count.
+
+Run it from the project root::
+
+    python -m benchmarks.scaling
+"""
+import argparse
+import os
+import sys
+import time
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "tests.app.settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+from django_bootstrap_swt.components import ListGroup, ListGroupItem, ButtonGroup, LinkButton, Card, CardBody, \
+    Badge  # noqa: E402
+from django_bootstrap_swt.enums import ButtonColorEnum  # noqa: E402
+from django_bootstrap_swt.utils import RenderHelper  # noqa: E402
+
+ITEM_COUNTS = (1000, 10000, 100000)
+# the time per item of the largest run may be this factor slower than the smallest run
+MAX_PER_ITEM_FACTOR = 3.0
+
+
+def render_list_group(count: int) -> str:
+    return ListGroup(items=[ListGroupItem(content=f'item {i}') for i in range(count)]).render()
+
+
+def render_button_group(count: int) -> str:
+    return ButtonGroup(aria_label='buttons',
+                       buttons=[LinkButton(url=f'/edit/{i}', content='edit', color=ButtonColorEnum.INFO)
+                                for i in range(count)]).render()
+
+
+def render_card(count: int) -> str:
+    return Card(body=CardBody(content=[Badge(content=str(i)) for i in range(count)])).render()
+
+
+def render_list_coherent(count: int) -> str:
+    return RenderHelper().render_list_coherent(items=[Badge(content=str(i)) for i in range(count)])
+
+
+SCENARIOS = {
+    'ListGroup': render_list_group,
+    'ButtonGroup': render_button_group,
+    'Card': render_card,
+    'RenderHelper.render_list_coherent': render_list_coherent,
+}
+
+
+def measure(func, count: int, repeat: int) -> float:
+    """:returns the best time per item in microseconds of :param repeat runs"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(count)
+        duration = time.perf_counter() - start
+        best = duration if best is None else min(best, duration)
+    return best / count * 1e6
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=3, help='runs per item count, the best run is used')
+    parser.add_argument('--counts', type=int, nargs='+', default=ITEM_COUNTS, help='item counts to measure')
+    args = parser.parse_args(argv)
+
+    failed = False
+    for name, func in SCENARIOS.items():
+        per_item = [measure(func, count, args.repeat) for count in args.counts]
+        factor = per_item[-1] / per_item[0]
+        linear = factor <= MAX_PER_ITEM_FACTOR
+        failed = failed or not linear
+        print(name)
+        for count, microseconds in zip(args.counts, per_item):
+            print(f'  {count:>8} items: {microseconds:8.2f} µs/item')
+        print(f'  factor {factor:.2f} -> {"linear" if linear else "NOT LINEAR"}')
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,5 +1,19 @@
 from django.apps import AppConfig
+from django.core.signals import setting_changed
+from django.utils.autoreload import file_changed
 
 
 class DjangoBootstrapSwtConfig(AppConfig):
     name = 'django_bootstrap_swt'
+
+    def ready(self):
+        from django_bootstrap_swt.fragments import clear_fragments, clear_on_setting_changed
+        from django_bootstrap_swt.loading import clear_component_templates, clear_on_templates_setting_changed, \
+            warm_up_enabled, warm_up_templates
+        file_changed.connect(clear_component_templates, dispatch_uid='django_bootstrap_swt_clear_templates')
+        file_changed.connect(clear_fragments, dispatch_uid='django_bootstrap_swt_clear_fragments')
+        setting_changed.connect(clear_on_templates_setting_changed,
+                                dispatch_uid='django_bootstrap_swt_clear_templates_setting')
+        setting_changed.connect(clear_on_setting_changed, dispatch_uid='django_bootstrap_swt_clear_fragments_setting')
+        if warm_up_enabled():
+            warm_up_templates()
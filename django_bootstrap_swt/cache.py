@@ -0,0 +1,174 @@
+import hashlib
+import sys
+import threading
+from collections import OrderedDict
+from django.core.cache import caches
+from django.utils.functional import Promise
+from django.utils.safestring import SafeData
+from django.utils.translation import get_language
+
+KEY_PREFIX = "django_bootstrap_swt.render"
+
+
+class Uncacheable(Exception):
+    """
+    Raised while building a render cache key for a configuration which can't be described by a stable key.
+    """
+    pass
+
+
+def normalize_value(value):
+    """
+    Normalizes an attribute or content value to a value with a stable representation.
+
+    :param value: the value to normalize
+    :return: the normalized value
+    :raises Uncacheable: if the value has no stable representation
+    """
+    if isinstance(value, SafeData):
+        # safe strings are rendered unescaped, so they must not share the key of the equal plain string
+        return 'safe', str(value)
+    if value is None or isinstance(value, (str, int, float)):
+        return value
+    if isinstance(value, Promise):
+        # lazy translations are resolved with the active language, which is part of the key
+        return str(value)
+    raise Uncacheable(value)
+
+
+def normalize_attrs(attrs: dict) -> tuple:
+    """
+    Normalizes the attrs dict of a Tag. The order of the attributes is kept, cause it is part of the rendered output.
+
+    :param attrs: the attrs dict of a Tag
+    :return: the normalized attrs as tuple
+    """
+    return tuple((normalize_value(attribute),
+                  tuple(normalize_value(value) for value in values) if values else None)
+                 for attribute, values in attrs.items())
+
+
+def make_key(structure) -> str:
+    """
+    Builds a stable key from a normalized component structure and the active language.
+
+    :param structure: the normalized structure of a component
+    :return: the key as string, which is stable over processes
+    """
+    digest = hashlib.sha256(repr((structure, get_language())).encode('utf-8')).hexdigest()
+    return f"{KEY_PREFIX}.{digest}"
+
+
+class RenderCache:
+    """
+    In-process LRU cache for rendered components. The cache is bounded by the memory size of the cached entries.
+    """
+    def __init__(self, max_bytes: int = 8 * 1024 * 1024):
+        """
+        :param max_bytes: Optional: the maximum memory size in bytes of all cached entries
+        """
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _entry_size(key: str, value: str) -> int:
+        return sys.getsizeof(key) + sys.getsizeof(value)
+
+    def get(self, key: str):
+        """
+        :param key: the key of the cached entry
+        :return: the cached rendered component | None if there is no entry for the key
+        """
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: str, value: str):
+        """
+        Stores the value and evicts the least recently used entries until the cache fits into max_bytes again.
+
+        :param key: the key of the entry
+        :param value: the rendered component
+        :return: None
+        """
+        entry_size = self._entry_size(key, value)
+        if entry_size > self.max_bytes:
+            return
+        with self._lock:
+            old_value = self._entries.pop(key, None)
+            if old_value is not None:
+                self.size -= self._entry_size(key, old_value)
+            self._entries[key] = value
+            self.size += entry_size
+            while self.size > self.max_bytes:
+                evicted_key, evicted_value = self._entries.popitem(last=False)
+                self.size -= self._entry_size(evicted_key, evicted_value)
+
+    def clear(self):
+        """Removes all entries and resets the counters"""
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+            self.hits = 0
+            self.misses = 0
+
+
+class DjangoRenderCache:
+    """
+    Render cache which stores the rendered components in one of the configured django cache backends. Eviction is
+    done by the backend.
+    """
+    def __init__(self, alias: str = 'default', timeout: int = None):
+        """
+        :param alias: Optional: the alias of the cache backend from the CACHES setting
+        :param timeout: Optional: the timeout of the entries in seconds. Default is the timeout of the backend.
+        """
+        self.alias = alias
+        self.timeout = timeout
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def backend(self):
+        """:returns the configured django cache backend"""
+        return caches[self.alias]
+
+    def get(self, key: str):
+        """
+        :param key: the key of the cached entry
+        :return: the cached rendered component | None if there is no entry for the key
+        """
+        value = self.backend.get(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def set(self, key: str, value: str):
+        """
+        :param key: the key of the entry
+        :param value: the rendered component
+        :return: None
+        """
+        if self.timeout is None:
+            self.backend.set(key, value)
+        else:
+            self.backend.set(key, value, timeout=self.timeout)
+
+    def clear(self):
+        """Resets the counters. Entries are not removed, cause the backend may be shared."""
+        self.hits = 0
+        self.misses = 0
@@ -1,18 +1,194 @@
+import copy
+import re
+import sys
 import uuid
 from abc import ABC
-from django.template.loader import render_to_string
+from functools import lru_cache
+from asgiref.sync import sync_to_async
+from django_bootstrap_swt.cache import Uncacheable, normalize_value, normalize_attrs, make_key
+from django_bootstrap_swt.ids import generate_id
+from django_bootstrap_swt.instrumentation import instrumented, instrumented_into, record_template_lookup
+from django_bootstrap_swt.fragments import get_fragment, register_fragment
+from django_bootstrap_swt.loading import get_component_template
 from django_bootstrap_swt.enums import ButtonColorEnum, TooltipPlacementEnum, ProgressColorEnum, BadgeColorEnum, \
     ButtonSizeEnum, ModalSizeEnum, TextColorEnum, BackgroundColorEnum, BorderColorEnum, DataToggleEnum, HeadingsEnum, \
-    AlertEnum
+    AlertEnum, PrefetchEnum
+from django.utils.formats import localize
+from django.utils.html import conditional_escape
+from django.utils.safestring import SafeData, SafeString
+from django.utils.timezone import template_localtime
 from django.utils.translation import gettext as _
 
 PATH_TO_TEMPLATES = "django_bootstrap_swt/components/"
+PATH_TO_INCLUDES = "django_bootstrap_swt/includes/"
+TAG_TEMPLATE_NAME = "tag.html"
+# attributes which are filled from enums and literals of the components. They have only a few distinct values, so their
+# serialized fragments are cached.
+INTERNED_ATTRIBUTES = frozenset(('class', 'role', 'type', 'data-toggle', 'data-placement', 'data-dismiss',
+                                 'aria-hidden'))
+
+
+def escape_value(value) -> str:
+    """Escapes a value the same way the django template engine does it for ``{{ value }}`` with autoescape on
+
+    :param value: the value to escape
+    :return: the escaped value as string
+    """
+    return conditional_escape(localize(template_localtime(value)))
+
+
+def serialize_attribute(attribute: str, values) -> str:
+    """Serializes one attribute of a tag the same way the tag.html template does it
+
+    :param attribute: the name of the attribute
+    :param values: the list of values of the attribute
+    :return: the serialized attribute with a leading space, like ` class="btn btn-primary"`
+    """
+    if values:
+        return ' ' + escape_value(attribute) + '="' + ' '.join([escape_value(value) for value in values]) + '"'
+    return ' ' + escape_value(attribute)
+
+
+@lru_cache(maxsize=4096)
+def interned_attribute(attribute: str, values: tuple) -> str:
+    """:returns the interned serialized attribute for values which are all plain strings, see serialize_attribute()"""
+    return sys.intern(serialize_attribute(attribute, values))
+
+
+def serialize_start_tag(tag: str, attrs: dict) -> str:
+    """Serializes a start tag the same way the tag.html template does it
+
+    :param tag: the tag name
+    :param attrs: the dict with the attributes and their list of values
+    :return: the serialized start tag
+    """
+    parts = ['<', escape_value(tag)]
+    for attribute, values in attrs.items():
+        if attribute in INTERNED_ATTRIBUTES and values and all(type(value) is str for value in values):
+            # enum driven values are serialized only once
+            parts.append(interned_attribute(attribute, tuple(values)))
+        else:
+            parts.append(serialize_attribute(attribute, values))
+    parts.append('>')
+    return ''.join(parts)
+
+
+class SafeHtml(SafeString):
+    """
+    The SafeString returned by the components. Unlike SafeString it concatenates with components as well, so rendered
+    components don't need to be copied into a plain str to be used with the magic functions of BootstrapComponent.
+    """
+    def __add__(self, rhs):
+        if isinstance(rhs, BootstrapComponent):
+            rhs = rhs.render(safe=True)
+        if not isinstance(rhs, str):
+            return NotImplemented
+        if isinstance(rhs, SafeData):
+            return SafeHtml(str.__add__(self, rhs))
+        return str.__add__(self, rhs)
+
+
+class _Chunks(list):
+    """
+    A list of string chunks with the write(str) function of a buffer. Nested components are rendered into it with
+    render_into(), so the chunks of all nesting levels are joined only once.
+    """
+    __slots__ = ()
+    write = list.append
+
+
+def as_safe_html(safe_string: SafeString) -> SafeHtml:
+    """Turns a SafeString, like the output of the template engine, into SafeHtml. The given string is not changed, a
+    SafeString is copied once into a new SafeHtml.
+
+    :param safe_string: the SafeString to convert
+    :return: the given string if it is SafeHtml already | a new SafeHtml with the same content
+    """
+    if type(safe_string) is SafeHtml:
+        return safe_string
+    return SafeHtml(safe_string)
+
+
+class ComponentPrototype:
+    """
+    This class renders a component once with placeholders for the given slots. Stamping the prototype fills the slots
+    with values, escaped the same way as the component would escape them, without rendering the component again.
+    """
+    # slots which change the markup of the component if they are empty, like the wrapper of a tooltip
+    optional_slots = ('tooltip',)
+
+    def __init__(self, component_class, slots: [str], **kwargs):
+        """
+        :param component_class: the class of the component to build the prototype for
+        :param slots: the names of the constructor arguments which are filled on stamping
+        :param kwargs: the constructor arguments of the component. If a slot name is passed, the value is used as
+                       default for stamping.
+        """
+        token = 'swtslot' + uuid.uuid4().hex
+        # The '&' of a marker is escaped to '&amp;' if the value is escaped on rendering. This way the rendered
+        # prototype tells us for every position of a slot if the stamped value needs to be escaped.
+        self.defaults = {slot: kwargs.pop(slot) for slot in slots if slot in kwargs}
+        self.component_class = component_class
+        self.slot_names = tuple(slots)
+        self.kwargs = kwargs
+        # prototypes rendered without the empty optional slots, by the names of these slots
+        self._variants = {}
+        markers = {slot: f'{token}{index}&' for index, slot in enumerate(slots)}
+        rendered = component_class(**kwargs, **markers).render()
+
+        self.literals = []
+        self.slots = []
+        position = 0
+        for match in re.finditer(re.escape(token) + r'(\d+)(&amp;|&)', rendered):
+            self.literals.append(rendered[position:match.start()])
+            self.slots.append((slots[int(match.group(1))], match.group(2) == '&amp;'))
+            position = match.end()
+        self.literals.append(rendered[position:])
+
+        missing_slots = set(slots) - {slot for slot, escape in self.slots}
+        if missing_slots:
+            raise ValueError(f"The slots {sorted(missing_slots)} are not part of the rendered "
+                             f"{component_class.__name__}")
+
+    def stamp(self, **values) -> str:
+        """
+        Fills the slots of this prototype with the given values.
+
+        :param values: the values of the slots by slot name
+        :return: the rendered component as string
+        """
+        empty_slots = tuple(slot for slot in self.optional_slots if slot in self.slot_names
+                            and not values.get(slot, self.defaults.get(slot, True)))
+        if empty_slots:
+            return self._get_variant(empty_slots).stamp(**{**self.defaults, **values})
+        parts = [self.literals[0]]
+        for (slot, escape), literal in zip(self.slots, self.literals[1:]):
+            try:
+                value = values[slot]
+            except KeyError:
+                try:
+                    value = self.defaults[slot]
+                except KeyError:
+                    raise TypeError(f"stamp() missing value for slot '{slot}'") from None
+            parts.append(escape_value(value) if escape else str(value))
+            parts.append(literal)
+        return ''.join(parts)
+
+    def _get_variant(self, empty_slots: tuple) -> 'ComponentPrototype':
+        variant = self._variants.get(empty_slots)
+        if variant is None:
+            variant = ComponentPrototype(self.component_class,
+                                         slots=[slot for slot in self.slot_names if slot not in empty_slots],
+                                         **self.kwargs, **dict.fromkeys(empty_slots))
+            self._variants[empty_slots] = variant
+        return variant
 
 
 class AbstractButton(ABC):
     """
     This class is used to group other Button representing components
     """
+    __slots__ = ()
     pass
 
 
@@ -20,13 +196,26 @@ class BootstrapComponent:
     """
     This is the base class for all components. It customizes some magic functions to get it running for concatenating
     without calling any function.
+
+    Rendering results can be cached by setting render_cache to a RenderCache or DjangoRenderCache instance, on this
+    class for all components or on a subclass for only some of them.
+
+    Components use __slots__ and export only the attributes named in context_attributes to their template. Instance
+    attributes of subclasses without __slots__ are exported as well.
     """
+    __slots__ = ('path_to_templates', 'template_name', 'needs_perm')
+    context_attributes = ()
+    render_cache = None
+    prototype_slots = ()
+
     def __init__(self, path_to_templates: str = PATH_TO_TEMPLATES, template_name: str = None, needs_perm: str = None,
                  *args, **kwargs):
         """
         :param path_to_templates: the relative path to the templates
         :param template_name: the name of the template which should be used for rendering
-        :param needs_perm: Only used in RenderHelper: the permission which is needed to see the component.
+        :param needs_perm: Only used in RenderHelper: the permission which is needed to see the component. Can also be
+                           a list of permissions which are all needed, a PermissionExpression like AnyOf or AllOf or
+                           a callable which gets the user permissions and returns a bool.
         :param args:
         :param kwargs:
         """
@@ -54,31 +243,89 @@ class BootstrapComponent:
         """:returns rendered component as string"""
         return self.render()
 
+    def get_context(self) -> dict:
+        """:returns the context which is used to render the template of this component"""
+        context = {}
+        for name in self.context_attributes:
+            try:
+                context[name] = getattr(self, name)
+            except AttributeError:
+                # unset optional slots are missing in the context like unset attributes before
+                pass
+        context.update(getattr(self, '__dict__', {}))
+        return context
+
+    @instrumented
     def render(self, safe: bool = False) -> str:
-        """Renders a template with self.__dict__ as context
+        """Renders a template with self.get_context() as context
+
+        The SafeString of the template engine is returned as SafeHtml for both values of safe, which concatenates with
+        plain strings and components without copying it into a plain str first. All components follow this contract.
+
+        :param safe: kept for compatibility, the rendered component is always SafeHtml, which is a SafeString
+        :return: rendered template as SafeHtml
+        """
+        record_template_lookup(self)
+        return as_safe_html(get_component_template(self.path_to_templates + self.template_name).render(
+            context=self.get_context()))
+
+    def iter_render(self):
+        """Renders this component chunk by chunk, for example to use it with django's StreamingHttpResponse
+
+        :return: a generator which yields the rendered component as string chunks
+        """
+        yield self.render()
+
+    def render_into(self, buffer):
+        """Renders this component into the given buffer. Nested components write into the same buffer, so no
+        intermediate strings are built for them.
+
+        :param buffer: an object with a write(str) function, like io.StringIO or django's HttpResponse
+        :return: None
+        """
+        buffer.write(self.render())
 
-        :param safe: switches if the rendered component is returned as SafeString or str
-        :return: rendered template as string | SafeString
+    async def arender(self, safe: bool = False) -> str:
+        """Async variant of render() for async views. The whole component including all nested components is rendered
+        with one sync_to_async call, so the event loop is not blocked by the template engine.
+
+        :param safe: kept for compatibility, see render()
+        :return: rendered component as SafeHtml
+        """
+        return await sync_to_async(self.render)(safe=safe)
+
+    @classmethod
+    def prototype(cls, slots: [str] = None, **kwargs) -> ComponentPrototype:
+        """Builds a prototype of this component, which is rendered only once. Use it for components which differ only
+        in a few values, like the action buttons of a list. Ids which are generated by the component are part of the
+        prototype, so don't use it for components with generated ids.
+
+        :param slots: Optional: the names of the constructor arguments which are filled on stamping.
+                      Default is self.prototype_slots.
+        :param kwargs: the constructor arguments of the component
+        :return: the prototype with a stamp(**values) function
+        """
+        return ComponentPrototype(cls, slots=slots if slots is not None else cls.prototype_slots, **kwargs)
+
+    def render_cache_key(self):
+        """:returns a normalized structure which describes the rendered output of this component |
+                    None if the output can't be described by such a structure and shall not be cached
         """
-        safe_string = render_to_string(template_name=self.path_to_templates + self.template_name, context=self.__dict__)
-        if safe:
-            return safe_string
-        # render_to_string() returns a SafeString, which implements it's own __add__ function.
-        # If we don't convert the SafeString to a normal str instance, we cant concatenate BootstrapComponent directly
-        # with our custom __add__, __iadd__, ... functions
-        byte_safe_string = str.encode(safe_string, encoding='utf-8')
-        return byte_safe_string.decode(encoding='utf-8')
+        return None
 
 
 class Tag(BootstrapComponent):
     """
-    This is a helper class for generic div rendering
+    This is a helper class for generic div rendering. The content can be a string, a BootstrapComponent or a list of
+    them. Child components are rendered not before this tag is rendered.
     """
-    def __init__(self, tag: str = None, content: str = None, attrs: {} = None, template_name: str = 'tag.html',
+    __slots__ = ('tag', 'content', 'attrs')
+    context_attributes = ('tag', 'content', 'attrs')
+    def __init__(self, tag: str = None, content: str = None, attrs: {} = None, template_name: str = TAG_TEMPLATE_NAME,
                  *args, **kwargs):
         """
         :param tag: the tag name
-        :param content: the content of this div
+        :param content: the content of this div; a string, a BootstrapComponent or a list of them
         :param attrs: Optional: a dict with with key value pairs which describes the attribute and his values
         :param args:
         :param kwargs:
@@ -110,12 +357,207 @@ class Tag(BootstrapComponent):
             for attribute, values in update_attrs.items():
                 self.update_attribute(attribute, values)
 
+    def with_attributes(self, update_attrs: dict = None, href: str = None):
+        """
+        Copy-on-write variant of update_attributes(). This tag is not changed, so it can be shared between threads and
+        rendered many times.
+
+        :param update_attrs: Optional: the dict with the update key value pairs. Value shall be a list
+        :param href: Optional: the new value of the href attribute
+        :return: a shallow copy of this tag with updated attributes
+        """
+        attrs = dict(self.attrs)
+        if update_attrs:
+            for attribute, values in update_attrs.items():
+                current = attrs.get(attribute)
+                if current:
+                    attrs[attribute] = current + [value for value in values if value not in current]
+                else:
+                    attrs[attribute] = list(values)
+        if href is not None:
+            attrs['href'] = [href]
+        tag = copy.copy(self)
+        tag.attrs = attrs
+        return tag
+
+    def render_content(self) -> str:
+        """:returns the content of this tag as string. Child components are rendered here."""
+        chunks = _Chunks()
+        self._write_content(chunks)
+        return ''.join(chunks)
+
+    def _write_content(self, buffer):
+        children = self.content if isinstance(self.content, (list, tuple)) else [self.content]
+        for child in children:
+            if isinstance(child, BootstrapComponent):
+                child.render_into(buffer)
+            else:
+                buffer.write(str(child))
+
+    def _write_tag(self, buffer):
+        buffer.write(self.start_tag())
+        if self.content:
+            self._write_content(buffer)
+        buffer.write(self.end_tag())
+
+    def get_context(self) -> dict:
+        """:returns the context which is used to render the template of this tag"""
+        context = super(Tag, self).get_context()
+        if isinstance(self.content, (list, tuple)):
+            context['content'] = self.render_content()
+        return context
+
+    def _content_cache_key(self, content):
+        if isinstance(content, (list, tuple)):
+            return tuple(self._content_cache_key(child) for child in content)
+        if isinstance(content, BootstrapComponent):
+            key = content.render_cache_key()
+            if key is None:
+                raise Uncacheable(content)
+            return key
+        return normalize_value(content)
+
+    def render_cache_key(self):
+        if not self.uses_default_template():
+            return None
+        try:
+            return 'tag', normalize_value(self.tag), normalize_attrs(self.attrs), self._content_cache_key(self.content)
+        except Uncacheable:
+            return None
+
+    def uses_default_template(self) -> bool:
+        """:returns True if this tag is rendered with the default tag.html template of this app"""
+        return self.path_to_templates == PATH_TO_TEMPLATES and self.template_name == TAG_TEMPLATE_NAME
+
+    def start_tag(self) -> str:
+        """:returns the serialized start tag with all attributes of this tag"""
+        return serialize_start_tag(self.tag, self.attrs)
+
+    def end_tag(self) -> str:
+        """:returns the serialized end tag of this tag"""
+        return '</' + escape_value(self.tag) + '>'
+
+    def serialize(self) -> str:
+        """Serializes this tag without the template engine. The result is identical to the rendered tag.html template.
+
+        :return: the serialized tag as string
+        """
+        chunks = _Chunks()
+        self._write_tag(chunks)
+        return ''.join(chunks)
+
+    def iter_content(self):
+        """:returns a generator which yields the content of this tag as string chunks"""
+        children = self.content if isinstance(self.content, (list, tuple)) else [self.content]
+        for child in children:
+            if isinstance(child, BootstrapComponent):
+                yield from child.iter_render()
+            else:
+                yield str(child)
+
+    def iter_render(self):
+        """Renders this tag chunk by chunk. Child components are streamed as own chunks.
+
+        :return: a generator which yields the rendered tag as string chunks
+        """
+        if not self.uses_default_template():
+            yield from super(Tag, self).iter_render()
+            return
+        yield self.start_tag()
+        if self.content:
+            yield from self.iter_content()
+        yield self.end_tag()
+
+    @instrumented_into
+    def render_into(self, buffer):
+        if not self.uses_default_template() or self.render_cache is not None:
+            super(Tag, self).render_into(buffer)
+            return
+        self._write_tag(buffer)
+
+    @instrumented
+    def render(self, safe: bool = False) -> str:
+        """Renders this tag. If the default tag.html template is used, the tag is serialized in pure python to skip
+        the template engine. Otherwise the configured template is rendered. Child components are serialized into the
+        chunks of this tag, so the result is copied into SafeHtml only once, here at the outermost tag.
+
+        :param safe: kept for compatibility, the rendered tag is always SafeHtml like the output of
+                     BootstrapComponent.render()
+        :return: rendered tag as SafeHtml
+        """
+        if not self.uses_default_template():
+            return super(Tag, self).render(safe=safe)
+        if self.render_cache is None:
+            return SafeHtml(self.serialize())
+        return self._serialize_cached()
+
+    def _serialize_cached(self) -> SafeHtml:
+        # Subclasses may extend render_cache_key() with state they render around this tag, like the tooltip.
+        # This function only serializes the tag itself, so the key of this class is used.
+        structure = Tag.render_cache_key(self)
+        if structure is None:
+            return SafeHtml(self.serialize())
+        key = make_key(structure)
+        serialized = self.render_cache.get(key)
+        if serialized is None:
+            # the cache keeps SafeHtml, so hits are returned without a copy
+            serialized = SafeHtml(self.serialize())
+            self.render_cache.set(key, serialized)
+        return as_safe_html(serialized)
+
+
+class StaticFragment(BootstrapComponent):
+    """
+    This class renders a registered static fragment, like the ajax loading spinner or a close button. The fragment is
+    rendered only once per active language and reused by all components, see django_bootstrap_swt.fragments.
+    """
+    __slots__ = ('name', )
+    context_attributes = ('name', )
+    def __init__(self, name: str, *args, **kwargs):
+        """
+        :param name: the name of the registered fragment
+        :param args:
+        :param kwargs:
+        """
+        super(StaticFragment, self).__init__(*args, **kwargs)
+        self.name = name
+
+    def render(self, safe: bool = False) -> str:
+        """:returns the memoized fragment as SafeHtml for both values of safe, like BootstrapComponent.render()"""
+        return as_safe_html(get_fragment(self.name))
+
+    def render_cache_key(self):
+        return 'fragment', self.name
+
+
+def _render_include(template_name: str):
+    # the fragment is memoized as SafeHtml, so StaticFragment returns it without a copy
+    return as_safe_html(get_component_template(PATH_TO_INCLUDES + template_name).render(context={}))
+
+
+def _close_button(attrs: dict):
+    times = Tag(tag="span", attrs={"aria-hidden": ["true"]}, content="&times;")
+    return Tag(tag="button", attrs=attrs, content=times).render(safe=True)
+
+
+register_fragment('ajax_loading_spinner', lambda: _render_include('ajax_loading_spinner.html'))
+register_fragment('ajax_error', lambda: _render_include('ajax_error.html'))
+register_fragment('alert_close_button', lambda: _close_button(attrs={"type": ["button"],
+                                                                     "class": ["close"],
+                                                                     "data-dismiss": ["alert"],
+                                                                     "aria-label": [_("Close")]}))
+register_fragment('modal_close_button', lambda: _close_button(attrs={"class": ["close"],
+                                                                     "type": ["button"],
+                                                                     "data-dismiss": ["modal"],
+                                                                     "aria-label": ["Close"]}))
+
 
 class Tooltip(Tag):
     """
     This class renders the Bootstrap Tooltip component.
     https://getbootstrap.com/docs/4.0/components/tooltips/
     """
+    __slots__ = ()
     def __init__(self, title: str, surrounded_component: str, placement: TooltipPlacementEnum = None, *args, **kwargs):
         """
         :param title: the title of the tooltip which is also the content of the tooltip to show
@@ -124,6 +566,12 @@ class Tooltip(Tag):
         :param args:
         :param kwargs:
         """
+        super(Tooltip, self).__init__(tag="span", attrs=self.get_attrs(title=title, placement=placement),
+                                      content=surrounded_component, *args, **kwargs)
+
+    @staticmethod
+    def get_attrs(title: str, placement: TooltipPlacementEnum = None) -> dict:
+        """:returns the attributes of a tooltip with the given title and placement"""
         attrs = {"class": ["d-inline-block"],
                  "tabindex": [0],
                  "data-html": ["true"],
@@ -131,13 +579,19 @@ class Tooltip(Tag):
                  "title": [title]}
         if placement:
             attrs.update({"data-placement": [placement.value]})
-        super(Tooltip, self).__init__(tag="span", attrs=attrs, content=surrounded_component, *args, **kwargs)
+        return attrs
+
+
+@lru_cache(maxsize=1024)
+def _tooltip_start_tag(title: str, placement: TooltipPlacementEnum) -> str:
+    return serialize_start_tag("span", Tooltip.get_attrs(title=title, placement=placement))
 
 
 class TooltipSurroundedComponent(Tag, ABC):
     """
     This is the helper class to surround a BootstrapComponent with a Tooltip.
     """
+    __slots__ = ('tooltip', 'tooltip_placement')
     def __init__(self, tooltip: str = None, tooltip_placement: TooltipPlacementEnum = None,
                  *args, **kwargs):
         """
@@ -151,12 +605,65 @@ class TooltipSurroundedComponent(Tag, ABC):
         self.tooltip_placement = tooltip_placement
         super(TooltipSurroundedComponent, self).__init__(*args, **kwargs)
 
+    def tooltip_start_tag(self) -> str:
+        """:returns the serialized start tag of the tooltip, which surrounds this component. It is the same as the
+                    start tag of Tooltip(title=self.tooltip, placement=self.tooltip_placement).
+        """
+        if type(self.tooltip) is str:
+            # most tooltips are repeated with the same title, like 'Edit' or 'Delete'
+            return _tooltip_start_tag(self.tooltip, self.tooltip_placement)
+        return serialize_start_tag("span", Tooltip.get_attrs(title=self.tooltip, placement=self.tooltip_placement))
+
+    @instrumented
     def render(self, safe: bool = False) -> str:
-        self_rendered = super(TooltipSurroundedComponent, self).render(safe=safe)
-        if self.tooltip:
-            return Tooltip(title=self.tooltip, surrounded_component=self_rendered,
-                           placement=self.tooltip_placement).render(safe=safe)
-        return self_rendered
+        """Renders this component. The tooltip is serialized around the component in the same pass.
+
+        :param safe: kept for compatibility, the rendered component is always SafeHtml
+        :return: rendered component as SafeHtml
+        """
+        if not self.tooltip:
+            return super(TooltipSurroundedComponent, self).render(safe=safe)
+        if self._streams_tooltip():
+            chunks = _Chunks()
+            self.render_into(chunks)
+            return SafeHtml(''.join(chunks))
+        return SafeHtml(''.join([self.tooltip_start_tag(), super(TooltipSurroundedComponent, self).render(),
+                                 '</span>']))
+
+    def render_cache_key(self):
+        key = super(TooltipSurroundedComponent, self).render_cache_key()
+        if key is None or not self.tooltip:
+            return key
+        try:
+            placement = self.tooltip_placement.value if self.tooltip_placement else None
+            return 'tooltip', key, normalize_value(self.tooltip), placement
+        except Uncacheable:
+            return None
+
+    def _streams_tooltip(self) -> bool:
+        # Templated or cached components fall back to render(), which already contains the tooltip
+        return bool(self.tooltip) and self.uses_default_template() and self.render_cache is None
+
+    def iter_render(self):
+        if not self.tooltip:
+            yield from super(TooltipSurroundedComponent, self).iter_render()
+        elif self._streams_tooltip():
+            yield self.tooltip_start_tag()
+            yield from super(TooltipSurroundedComponent, self).iter_render()
+            yield '</span>'
+        else:
+            yield self.render()
+
+    @instrumented_into
+    def render_into(self, buffer):
+        if not self.tooltip:
+            super(TooltipSurroundedComponent, self).render_into(buffer)
+        elif self._streams_tooltip():
+            buffer.write(self.tooltip_start_tag())
+            super(TooltipSurroundedComponent, self).render_into(buffer)
+            buffer.write('</span>')
+        else:
+            buffer.write(self.render())
 
 
 class Alert(Tag):
@@ -164,18 +671,14 @@ class Alert(Tag):
     This class renders the Bootstrap Alert component.
     https://getbootstrap.com/docs/4.0/components/alerts/
     """
+    __slots__ = ()
     def __init__(self, msg: str, alert_type: AlertEnum, dismiss: bool = True, *args, **kwargs):
         self.attrs = {"class": ["alert", alert_type.value, "fade", "show"],
                       "role": ["alert"]}
 
         if dismiss:
             self.update_attribute(attribute="class", values=["alert-dismissible"])
-            times = Tag(tag="span", attrs={"aria-hidden": ["true"]}, content="&times;").render()
-            dismiss_btn = Tag(tag="button", attrs={"type": ["button"],
-                                                   "class": ["close"],
-                                                   "data-dismiss": ["alert"],
-                                                   "aria-label": [_("Close")]}, content=times)
-            msg += dismiss_btn
+            msg = [msg, StaticFragment(name='alert_close_button')]
 
         super(Alert, self).__init__(tag="div", attrs=self.attrs, content=msg, *args, **kwargs)
 
@@ -185,6 +688,7 @@ class ProgressBar(Tag):
     This class renders the Bootstrap Progress component.
     https://getbootstrap.com/docs/4.0/components/progress
     """
+    __slots__ = ()
     def __init__(self, progress: int = 0, color: ProgressColorEnum = None, striped: bool = True, animated: bool = True,
                  *args, **kwargs):
         """
@@ -211,7 +715,7 @@ class ProgressBar(Tag):
         if animated:
             self.update_attribute("class", ["progress-bar-animated"])
 
-        bar = Tag(tag=tag, attrs=self.attrs, content=f"{progress}%").render()
+        bar = Tag(tag=tag, attrs=self.attrs, content=f"{progress}%")
         super(ProgressBar, self).__init__(tag=tag, attrs=attrs, content=bar, *args, **kwargs)
 
 
@@ -220,6 +724,7 @@ class Badge(TooltipSurroundedComponent):
     This class renders the Bootstrap Badge component.
     https://getbootstrap.com/docs/4.0/components/badge/
     """
+    __slots__ = ()
     def __init__(self, content: str, pill: bool = False, color: BadgeColorEnum = BadgeColorEnum.INFO, *args, **kwargs):
         """
         :param content: the content of the badge
@@ -241,6 +746,9 @@ class Link(TooltipSurroundedComponent):
     """
     This class renders the a HTML Link with bootstrap depending css if needed.
     """
+    __slots__ = ()
+    prototype_slots = ('url', 'tooltip')
+
     def __init__(self, url: str, content: str, color: TextColorEnum = None, open_in_new_tab: bool = False,
                  dropdown_item: bool = False, *args, **kwargs):
         """
@@ -268,6 +776,9 @@ class LinkButton(TooltipSurroundedComponent, AbstractButton):
     This class renders the a HTML Link as a Bootstrap Button.
     https://getbootstrap.com/docs/4.0/components/buttons/#button-tags
     """
+    __slots__ = ()
+    prototype_slots = ('url', 'tooltip')
+
     def __init__(self, url: str, content: str, color: ButtonColorEnum, size: ButtonSizeEnum = None,
                  open_in_new_tab: bool = False, *args, **kwargs):
         """
@@ -296,6 +807,7 @@ class Button(TooltipSurroundedComponent, AbstractButton):
     This class renders the Bootstrap Button component.
     https://getbootstrap.com/docs/4.0/components/buttons/
     """
+    __slots__ = ('button_id', )
     def __init__(self, content: str, color: ButtonColorEnum = None, size: ButtonSizeEnum = None,
                  data_toggle: DataToggleEnum = None,
                  data_target: str = None, aria_expanded: bool = None, aria_controls: str = None,
@@ -313,7 +825,7 @@ class Button(TooltipSurroundedComponent, AbstractButton):
         :param args:
         :param kwargs:
         """
-        self.button_id = 'id_' + str(uuid.uuid4())
+        self.button_id = generate_id()
         self.attrs = {"id": [self.button_id],
                       "type": ["button"],
                       "class": ["btn"]}
@@ -344,6 +856,7 @@ class ModalHeader(Tag):
     This class renders the Bootstrap ModalHeader component.
     https://getbootstrap.com/docs/4.0/components/modal/
     """
+    __slots__ = ()
     def __init__(self, content: str, heading_size: HeadingsEnum = HeadingsEnum.H5, closeable: bool = True, *args,
                  **kwargs):
         """
@@ -353,15 +866,9 @@ class ModalHeader(Tag):
         """
         self.attrs = {"class": ["modal-header"]}
 
-        self.content = Tag(tag=heading_size.value, attrs={"class": ["modal-title"]}, content=content).render()
+        self.content = [Tag(tag=heading_size.value, attrs={"class": ["modal-title"]}, content=content)]
         if closeable:
-            close_sym = Tag(tag='span', attrs={"aria-hidden": ["true"]}, content="&times;").render()
-            self.content += Tag(tag='button',
-                                attrs={"class": ["close"],
-                                       "type": ["button"],
-                                       "data-dismiss": ["modal"],
-                                       "aria-label": ["Close"]},
-                                content=close_sym, )
+            self.content.append(StaticFragment(name='modal_close_button'))
 
         super(ModalHeader, self).__init__(tag="div", attrs=self.attrs, content=self.content, *args, **kwargs)
 
@@ -371,6 +878,7 @@ class ModalBody(Tag):
     This class renders the Bootstrap ModalBody component.
     https://getbootstrap.com/docs/4.0/components/modal/
     """
+    __slots__ = ()
     def __init__(self, content: str, *args, **kwargs):
         """
         :param content: the content of the header
@@ -387,6 +895,7 @@ class ModalFooter(Tag):
     This class renders the Bootstrap ModalBody component.
     https://getbootstrap.com/docs/4.0/components/modal/
     """
+    __slots__ = ()
     def __init__(self, content: str, *args, **kwargs):
         """
         :param content: the content of the header
@@ -403,10 +912,14 @@ class Modal(BootstrapComponent):
     This class renders the Bootstrap Modal component.
     https://getbootstrap.com/docs/4.0/components/modal/
     """
+    __slots__ = ('modal_id', 'header', 'body', 'footer', 'fade', 'size', 'fetch_url', 'backdrop', 'clos_on_esc',
+                 'cache_ttl', 'prefetch', 'button')
+    context_attributes = ('modal_id', 'header', 'body', 'footer', 'fade', 'size', 'fetch_url', 'backdrop',
+                          'clos_on_esc', 'cache_ttl', 'prefetch')
     def __init__(self, btn_content: str, header=None, body=None, btn_attrs: dict = None,
                  footer=None, fade: bool = True, size: ModalSizeEnum = None, fetch_url: str = None,
-                 btn_tooltip: str = None, backdrop: bool = True, clos_on_esc: bool = True,
-                 *args, **kwargs):
+                 btn_tooltip: str = None, backdrop: bool = True, clos_on_esc: bool = True, cache_ttl: int = None,
+                 prefetch: PrefetchEnum = None, *args, **kwargs):
         """
         :param btn_content: the value of the button which opens the modal
         :param header: Optional: the title of the modal
@@ -418,11 +931,14 @@ class Modal(BootstrapComponent):
         :param size: Optional: the size of the modal
         :param fetch_url: Optional: the url where the content will be fetched from on modal shown event
         :param btn_tooltip: Optional: the tooltip of the modal toggle button
+        :param cache_ttl: Optional: the number of seconds the fetched content is cached in the browser
+        :param prefetch: Optional: fetches the content before the modal is shown; on hover or focus of the modal
+                         toggle button or when the browser is idle
         :param args:
         :param kwargs:
         """
         super(Modal, self).__init__(template_name="modal.html", *args, **kwargs)
-        self.modal_id = 'id_' + str(uuid.uuid4())
+        self.modal_id = generate_id()
         if header and isinstance(header, str):
             self.header = ModalHeader(content=header)
             self.header.update_attribute(attribute="id", values=[f"{self.modal_id}_header"])
@@ -443,19 +959,20 @@ class Modal(BootstrapComponent):
         self.fetch_url = fetch_url
         self.backdrop = backdrop
         self.clos_on_esc = clos_on_esc
+        self.cache_ttl = cache_ttl
+        self.prefetch = prefetch
         self.button = Button(content=btn_content, data_toggle=DataToggleEnum.MODAL,
                              data_target=f'{self.modal_id}', tooltip=btn_tooltip)
         self.button.update_attributes(update_attrs=btn_attrs)
-        self.rendered_button = None
-
-    def render(self, safe: bool = False) -> str:
-        """Renders a template with self.__dict__ as context
 
-        :param safe: switches if the rendered component is returned as SafeString or str
-        :return: rendered template as string | SafeString
-        """
-        self.rendered_button = self.button.render()
-        return super().render(safe=safe)
+    def get_context(self) -> dict:
+        """:returns the context which is used to render the template of this modal"""
+        context = super(Modal, self).get_context()
+        context['rendered_button'] = self.button.render()
+        if self.fetch_url:
+            context['ajax_loading_spinner'] = get_fragment('ajax_loading_spinner')
+            context['ajax_error'] = get_fragment('ajax_error')
+        return context
 
 
 class CardHeader(Tag):
@@ -463,6 +980,7 @@ class CardHeader(Tag):
     This class renders the Bootstrap Card Header component.
     https://getbootstrap.com/docs/4.0/components/card/#header-and-footer
     """
+    __slots__ = ('header_id', )
     def __init__(self, content: str, header_id: uuid = None, bg_color: BackgroundColorEnum = None,
                  text_color: TextColorEnum = None, border: BorderColorEnum = None, *args, **kwargs):
         """
@@ -474,7 +992,7 @@ class CardHeader(Tag):
         :param args:
         :param kwargs:
         """
-        self.header_id = 'id_' + str(header_id) if header_id else 'id_' + str(uuid.uuid4())
+        self.header_id = 'id_' + str(header_id) if header_id else generate_id()
         self.attrs = {"id": [self.header_id],
                       "class": ["card-header"]}
         if bg_color:
@@ -492,9 +1010,11 @@ class CardBody(Tag):
     This class renders the Bootstrap Card Body component.
     https://getbootstrap.com/docs/4.0/components/card/#content-types
     """
+    __slots__ = ('body_id', )
     def __init__(self, content: str = None, body_id: uuid = None, bg_color: BackgroundColorEnum = None,
                  text_color: TextColorEnum = None, border: BorderColorEnum = None, fetch_url: str = None,
-                 data_parent: str = None, aria_labelledby: str = None, *args, **kwargs):
+                 data_parent: str = None, aria_labelledby: str = None, cache_ttl: int = None,
+                 prefetch: PrefetchEnum = None, *args, **kwargs):
         """
         :param content: Optional: the content of the card body
         :param body_id: Optional: the id of the body div
@@ -504,10 +1024,13 @@ class CardBody(Tag):
         :param fetch_url: Optional: is used from Modal class to set the fetch_url for this div
         :param data_parent: Optional: sets the data_parent attribute
         :param aria_labelledby: Optional: sets the aria_labelledby attribute
+        :param cache_ttl: Optional: the number of seconds the fetched content is cached in the browser
+        :param prefetch: Optional: fetches the content before the card body is shown; on hover or focus of the toggle
+                         button or when the browser is idle
         :param args:
         :param kwargs:
         """
-        self.body_id = 'id_' + str(body_id) if body_id else 'id_' + str(uuid.uuid4())
+        self.body_id = 'id_' + str(body_id) if body_id else generate_id()
         self.attrs = {"id": [self.body_id],
                       "class": ["card-body"]}
         if bg_color:
@@ -518,6 +1041,10 @@ class CardBody(Tag):
             self.update_attribute("class", [text_color.value])
         if fetch_url:
             self.update_attribute("data-url", [fetch_url])
+            if cache_ttl:
+                self.update_attribute("data-cache-ttl", [str(cache_ttl)])
+            if prefetch:
+                self.update_attribute("data-prefetch", [prefetch.value])
         if data_parent:
             self.update_attribute("data-parent", [f"#{data_parent}"])
         if aria_labelledby:
@@ -531,6 +1058,7 @@ class CardFooter(Tag):
     This class renders the Bootstrap Card Footer component.
     https://getbootstrap.com/docs/4.0/components/card/#header-and-footer
     """
+    __slots__ = ()
     def __init__(self, content: str, bg_color: BackgroundColorEnum = None, text_color: TextColorEnum = None,
                  border: BorderColorEnum = None,  *args, **kwargs):
         """
@@ -557,6 +1085,7 @@ class Card(Tag):
     This class renders the Bootstrap Card component.
     https://getbootstrap.com/docs/4.0/components/card/
     """
+    __slots__ = ()
     def __init__(self, body: CardBody, header: CardHeader = None, footer: CardFooter = None,
                  bg_color: BackgroundColorEnum = None, text_color: TextColorEnum = None,
                  border: BorderColorEnum = None, *args, **kwargs):
@@ -577,13 +1106,7 @@ class Card(Tag):
             self.update_attribute("class", [border.value])
         if text_color:
             self.update_attribute("class", [text_color.value])
-        self.content = ''
-        if header:
-            self.content += header
-        if body:
-            self.content += body
-        if footer:
-            self.content += footer
+        self.content = [component for component in (header, body, footer) if component]
         super(Card, self).__init__(tag="div", attrs=self.attrs, content=self.content, *args, **kwargs)
 
 
@@ -592,25 +1115,31 @@ class Accordion(Tag):
     This class renders the Bootstrap Accordion component.
     https://getbootstrap.com/docs/4.0/components/collapse/#accordion-example
     """
+    __slots__ = ('accordion_id', 'card_body', 'accordion_btn', 'card_header', 'card')
     def __init__(self, btn_value: str, content: str = None, fetch_url: str = None, header_center_content: str = None,
                  header_right_content: str = None, card_header_attrs: dict = None, card_body_attrs: dict = None,
-                 card_attrs: dict = None, button_attrs: dict = None, *args, **kwargs):
+                 card_attrs: dict = None, button_attrs: dict = None, cache_ttl: int = None,
+                 prefetch: PrefetchEnum = None, *args, **kwargs):
         """
         :param btn_value: the value of the button to toggle the accordion
         :param content: the content of the accordion
         :param fetch_url: Optional: the url where the content will be fetched from on accordion shown event
         :param header_center_content: the content of the header center placed
         :param header_right_content: the content of the header right placed
+        :param cache_ttl: Optional: the number of seconds the fetched content is cached in the browser
+        :param prefetch: Optional: fetches the content before the accordion is expanded; on hover or focus of the
+                         accordion button or when the browser is idle
         :param args:
         :param kwargs:
         """
-        self.accordion_id = 'id_' + str(uuid.uuid4())
+        self.accordion_id = generate_id()
         if fetch_url:
-            content = render_to_string("django_bootstrap_swt/includes/ajax_loading_spinner.html")
-            content += render_to_string("django_bootstrap_swt/includes/ajax_error.html")
+            content = [StaticFragment(name='ajax_loading_spinner'), StaticFragment(name='ajax_error')]
         self.card_body = CardBody(content=content,
                                   fetch_url=fetch_url,
-                                  data_parent=self.accordion_id)
+                                  data_parent=self.accordion_id,
+                                  cache_ttl=cache_ttl,
+                                  prefetch=prefetch)
         self.card_body.update_attribute("class", ["collapse"])
         self.card_body.update_attributes(update_attrs=card_body_attrs)
 
@@ -622,9 +1151,9 @@ class Accordion(Tag):
         self.accordion_btn.update_attribute("class", ['collapsed', 'accordion', 'text-left'])
         self.accordion_btn.update_attributes(update_attrs=button_attrs)
 
-        default_header_row = DefaultHeaderRow(content_left=self.accordion_btn.render(),
+        default_header_row = DefaultHeaderRow(content_left=self.accordion_btn,
                                               content_center=header_center_content,
-                                              content_right=header_right_content).render()
+                                              content_right=header_right_content)
 
         self.card_header = CardHeader(content=default_header_row)
         self.card_header.update_attributes(update_attrs=card_header_attrs)
@@ -635,7 +1164,7 @@ class Accordion(Tag):
 
         self.attrs = {"id": [self.accordion_id],
                       "class": ["accordion"]}
-        super(Accordion, self).__init__(tag="div", attrs=self.attrs, content=self.card.render(), *args, **kwargs)
+        super(Accordion, self).__init__(tag="div", attrs=self.attrs, content=self.card, *args, **kwargs)
 
 
 class ButtonGroup(Tag):
@@ -643,6 +1172,7 @@ class ButtonGroup(Tag):
     This class renders the Bootstrap Button Group component.
     https://getbootstrap.com/docs/4.0/components/button-group/
     """
+    __slots__ = ()
     def __init__(self, aria_label: str, buttons: [AbstractButton], *args, **kwargs):
         """
         :param aria_label: sets the aria_label attribute
@@ -653,10 +1183,7 @@ class ButtonGroup(Tag):
         self.attrs = {"class": ["btn-group"],
                       "role": ["group"],
                       "aria-label": [aria_label], }
-        content = ''
-        for button in buttons:
-            content += button
-        super(ButtonGroup, self).__init__(tag="div", attrs=self.attrs, content=content, *args, **kwargs)
+        super(ButtonGroup, self).__init__(tag="div", attrs=self.attrs, content=list(buttons), *args, **kwargs)
 
 
 class Dropdown(TooltipSurroundedComponent):
@@ -664,6 +1191,8 @@ class Dropdown(TooltipSurroundedComponent):
     This class renders the Bootstrap Dropdown component.
     https://getbootstrap.com/docs/4.0/components/dropdowns/
     """
+    __slots__ = ('value', 'color', 'button', 'dropdown_id', 'items', 'header')
+    context_attributes = ('button', 'dropdown_id', 'items', 'header')
     def __init__(self, btn_value: str, items: [Link], color: ButtonColorEnum = ButtonColorEnum.INFO, header: str = None,
                  btn_attrs: dict = None, *args, **kwargs):
         """
@@ -682,10 +1211,9 @@ class Dropdown(TooltipSurroundedComponent):
         self.button.update_attributes(update_attrs=btn_attrs)
         self.button.update_attribute("class", ['dropdown-toggle'])
         self.dropdown_id = self.button.button_id
-        self.items = []
-        for item in items:
+        self.items = list(items)
+        for item in self.items:
             item.update_attribute("class", ["dropdown-item"])
-            self.items.append(item.render())
         self.header = header
 
 
@@ -694,6 +1222,7 @@ class ListGroupItem(Tag):
     This class renders the Bootstrap List Group Item component.
     https://getbootstrap.com/docs/4.0/components/list-group/
     """
+    __slots__ = ()
     def __init__(self, content: str, *args, **kwargs):
         """
         :param content: content of the item
@@ -710,6 +1239,7 @@ class ListGroup(Tag):
     This class renders the Bootstrap List Group component.
     https://getbootstrap.com/docs/4.0/components/list-group/
     """
+    __slots__ = ()
     def __init__(self, items: [ListGroupItem], *args, **kwargs):
         """
         :param items: a list of items which shall be part of this ListGroup
@@ -717,9 +1247,7 @@ class ListGroup(Tag):
         :param kwargs:
         """
         self.attrs = {"class": ["list-group"], }
-        self.content = ''
-        for item in items:
-            self.content += item
+        self.content = list(items)
         super(ListGroup, self).__init__(tag="ul", attrs=self.attrs, content=self.content, *args, **kwargs)
 
 
@@ -727,6 +1255,7 @@ class DefaultHeaderRow(BootstrapComponent):
     """
     This is a helper class for standardized headers with three columns
     """
+    __slots__ = ('content_left', 'content_center', 'content_right')
     def __init__(self, content_left: str, content_right: str, content_center: str = None, *args, **kwargs):
         """
         :param content_left: the left content in this row
@@ -740,7 +1269,8 @@ class DefaultHeaderRow(BootstrapComponent):
         self.content_center = content_center
         self.content_right = content_right
 
-    def render(self, safe: bool = False) -> str:
+    def get_row(self) -> Tag:
+        """:returns the row Tag with the columns of this header row. The columns are rendered not before the row."""
         col_left = Tag(tag='div',
                        content=self.content_left,
                        attrs={"class": ['col-sm', 'text-left']})
@@ -749,14 +1279,24 @@ class DefaultHeaderRow(BootstrapComponent):
                              content=self.content_center,
                              attrs={"class": ['col-sm', 'text-center']})
         else:
-            col_center = ''
+            col_center = None
         if self.content_right:
             col_right = Tag(tag='div',
                             content=self.content_right,
                             attrs={"class": ['col-sm', 'text-right']})
         else:
-            col_right = ''
-        content = col_left + col_center + col_right
+            col_right = None
+        content = [col for col in (col_left, col_center, col_right) if col]
         return Tag(tag='div',
                    content=content,
-                   attrs={"class": ['row']}).render(safe=safe)
+                   attrs={"class": ['row']})
+
+    @instrumented
+    def render(self, safe: bool = False) -> str:
+        return self.get_row().render(safe=safe)
+
+    def iter_render(self):
+        yield from self.get_row().iter_render()
+
+    def render_into(self, buffer):
+        self.get_row().render_into(buffer)
@@ -0,0 +1,10 @@
+from django.utils.functional import SimpleLazyObject
+from django_bootstrap_swt.utils import get_render_helper
+
+
+def render_helper(request) -> dict:
+    """
+    Adds the RenderHelper of the request as render_helper to the template context. It is shared with the
+    RenderHelperMiddleware and built not before it is used.
+    """
+    return {'render_helper': SimpleLazyObject(lambda: get_render_helper(request))}
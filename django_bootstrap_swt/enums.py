@@ -116,3 +116,8 @@ class HeadingsEnum(Enum):
     H4 = "h4"
     H5 = "h5"
     H6 = "h6"
+
+
+class PrefetchEnum(Enum):
+    HOVER = "hover"
+    IDLE = "idle"
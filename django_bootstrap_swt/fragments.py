@@ -0,0 +1,50 @@
+from django.utils.translation import get_language
+
+# the builders of the static fragments by fragment name
+_builders = {}
+# the rendered fragments by (fragment name, language)
+_rendered = {}
+
+
+def register_fragment(name: str, builder):
+    """
+    Registers a static fragment. A static fragment is rendered only once per active language and reused afterwards.
+
+    :param name: the unique name of the fragment
+    :param builder: a callable without arguments which returns the rendered fragment as SafeString
+    :return: None
+    """
+    _builders[name] = builder
+    for key in [key for key in _rendered if key[0] == name]:
+        del _rendered[key]
+
+
+def get_fragment(name: str):
+    """
+    Returns the rendered static fragment for the active language.
+
+    :param name: the name of the registered fragment
+    :return: the rendered fragment as SafeString
+    :raises KeyError: if no fragment with the given name is registered
+    """
+    key = (name, get_language())
+    try:
+        return _rendered[key]
+    except KeyError:
+        fragment = _rendered[key] = _builders[name]()
+        return fragment
+
+
+def clear_fragments(**kwargs):
+    """
+    Drops all rendered fragments, so they are rendered again on the next usage. Connected to the autoreload
+    file_changed signal and to the setting_changed signal.
+
+    :return: None, so django's own template reset on file changes is not influenced
+    """
+    _rendered.clear()
+
+
+def clear_on_setting_changed(setting: str, **kwargs):
+    if setting in ('TEMPLATES', 'LANGUAGE_CODE', 'LANGUAGES', 'LOCALE_PATHS'):
+        clear_fragments()
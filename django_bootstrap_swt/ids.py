@@ -0,0 +1,79 @@
+import contextvars
+import itertools
+import uuid
+from contextlib import contextmanager
+from functools import lru_cache
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+_id_factory = contextvars.ContextVar('django_bootstrap_swt_id_factory', default=None)
+
+
+def uuid_id_factory() -> str:
+    """:returns a random uuid4 as id. This is the default id factory."""
+    return str(uuid.uuid4())
+
+
+class CounterIdFactory:
+    """
+    This class generates cheap and deterministic sequential ids. Use a namespace to avoid id collisions with
+    components of ajax loaded fragments, which are rendered in another request.
+    """
+    def __init__(self, namespace: str = None, start: int = 1):
+        """
+        :param namespace: Optional: the prefix of all generated ids
+        :param start: Optional: the first number of the sequence
+        """
+        self.namespace = namespace
+        self._counter = itertools.count(start)
+
+    def __call__(self) -> str:
+        number = next(self._counter)
+        return f"{self.namespace}-{number}" if self.namespace else str(number)
+
+
+@lru_cache(maxsize=None)
+def _import_id_factory(path: str):
+    return import_string(path)
+
+
+def get_id_factory():
+    """
+    :return: the id factory of the current context | the factory configured by the BOOTSTRAP_SWT_ID_FACTORY setting |
+             uuid_id_factory
+    """
+    factory = _id_factory.get()
+    if factory is not None:
+        return factory
+    path = getattr(settings, 'BOOTSTRAP_SWT_ID_FACTORY', None)
+    return _import_id_factory(path) if path else uuid_id_factory
+
+
+def generate_id() -> str:
+    """:returns a new html id for a component, generated by the current id factory"""
+    return 'id_' + get_id_factory()()
+
+
+@contextmanager
+def id_factory(factory):
+    """
+    Uses the given factory for all ids which are generated inside this context.
+
+    :param factory: a callable without arguments which returns a new id on every call
+    :return: the factory
+    """
+    token = _id_factory.set(factory)
+    try:
+        yield factory
+    finally:
+        _id_factory.reset(token)
+
+
+def id_namespace(namespace: str = None):
+    """
+    Generates sequential ids with the given namespace for all components which are constructed inside this context.
+
+    :param namespace: Optional: the prefix of all generated ids
+    :return: the context manager
+    """
+    return id_factory(CounterIdFactory(namespace=namespace))
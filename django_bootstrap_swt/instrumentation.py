@@ -0,0 +1,202 @@
+import contextvars
+import functools
+import time
+from contextlib import contextmanager
+
+_render_stats = contextvars.ContextVar('django_bootstrap_swt_render_stats', default=None)
+
+
+class ComponentStats:
+    """
+    This class holds the render statistics of one component class.
+    """
+    def __init__(self):
+        self.renders = 0
+        self.duration = 0.0
+        self.template_lookups = 0
+        self.bytes = 0
+
+    def as_dict(self) -> dict:
+        """:returns the statistics as dict; the duration in milliseconds"""
+        return {'renders': self.renders,
+                'duration': self.duration * 1000,
+                'template_lookups': self.template_lookups,
+                'bytes': self.bytes}
+
+
+class _CountingBuffer:
+    """
+    This class counts the length of the chunks which are written through it into the wrapped buffer.
+    """
+    __slots__ = ('buffer', 'size')
+
+    def __init__(self, buffer):
+        self.buffer = buffer
+        self.size = 0
+
+    def write(self, chunk: str):
+        self.size += len(chunk)
+        self.buffer.write(chunk)
+
+
+class RenderStats:
+    """
+    This class collects the render statistics per component class. The duration of a component includes the duration
+    of its nested components. The total duration only counts the outermost renders, so nested renders are not counted
+    twice.
+    """
+    def __init__(self):
+        self.components = {}
+        self.duration = 0.0
+        self._rendering = []
+
+    def _get_component_stats(self, component) -> ComponentStats:
+        name = type(component).__name__
+        stats = self.components.get(name)
+        if stats is None:
+            stats = self.components[name] = ComponentStats()
+        return stats
+
+    def record_render(self, component, render, *args, **kwargs):
+        """
+        Calls the render function and records its statistics for the class of the component.
+
+        :param component: the component which is rendered
+        :param render: the render function to call
+        :return: the result of the render function
+        """
+        if self._rendering and self._rendering[-1] is component:
+            # super().render() of the same component is already recorded by the outer call
+            return render(component, *args, **kwargs)
+        self._rendering.append(component)
+        start = time.perf_counter()
+        try:
+            rendered = render(component, *args, **kwargs)
+        finally:
+            duration = time.perf_counter() - start
+            self._rendering.pop()
+        self._add_render(component, duration, len(rendered))
+        return rendered
+
+    def record_render_into(self, component, render_into, buffer):
+        """
+        Calls the render_into function and records its statistics for the class of the component.
+
+        :param component: the component which is rendered
+        :param render_into: the render_into function to call
+        :param buffer: the buffer to render into
+        :return: None
+        """
+        if self._rendering and self._rendering[-1] is component:
+            # render() and render_into() of the same component are recorded once by the outer call
+            render_into(component, buffer)
+            return
+        counting_buffer = _CountingBuffer(buffer)
+        self._rendering.append(component)
+        start = time.perf_counter()
+        try:
+            render_into(component, counting_buffer)
+        finally:
+            duration = time.perf_counter() - start
+            self._rendering.pop()
+        self._add_render(component, duration, counting_buffer.size)
+
+    def _add_render(self, component, duration: float, size: int):
+        stats = self._get_component_stats(component)
+        stats.renders += 1
+        stats.duration += duration
+        stats.bytes += size
+        if not self._rendering:
+            self.duration += duration
+
+    def record_template_lookup(self, component):
+        """
+        Counts a template lookup for the class of the component.
+
+        :param component: the component which renders a template
+        :return: None
+        """
+        self._get_component_stats(component).template_lookups += 1
+
+    @property
+    def renders(self) -> int:
+        """:returns the number of renders of all components"""
+        return sum(stats.renders for stats in self.components.values())
+
+    @property
+    def template_lookups(self) -> int:
+        """:returns the number of template lookups of all components"""
+        return sum(stats.template_lookups for stats in self.components.values())
+
+    def as_dict(self) -> dict:
+        """:returns the totals and the statistics per component class as dict, e.g. for logging"""
+        return {'renders': self.renders,
+                'duration': self.duration * 1000,
+                'template_lookups': self.template_lookups,
+                'components': {name: stats.as_dict() for name, stats in self.components.items()}}
+
+    def server_timing(self) -> str:
+        """:returns the statistics as value of a Server-Timing header"""
+        metrics = [f'swt;dur={self.duration * 1000:.2f};desc="django-bootstrap-swt {self.renders} renders"']
+        for name, stats in sorted(self.components.items()):
+            metrics.append(f'swt-{name};dur={stats.duration * 1000:.2f};desc="{stats.renders} renders"')
+        return ', '.join(metrics)
+
+
+def get_render_stats():
+    """:returns the RenderStats which are collected in the current context | None if nothing is collected"""
+    return _render_stats.get()
+
+
+@contextmanager
+def collect_render_stats():
+    """
+    Collects the render statistics of all components which are rendered inside this context.
+
+    :return: the RenderStats
+    """
+    stats = RenderStats()
+    token = _render_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _render_stats.reset(token)
+
+
+def instrumented(render):
+    """
+    Decorator for the render functions of the components. The statistics are only recorded inside of
+    collect_render_stats(), otherwise the render function is called directly.
+    """
+    @functools.wraps(render)
+    def wrapper(self, *args, **kwargs):
+        stats = _render_stats.get()
+        if stats is None:
+            return render(self, *args, **kwargs)
+        return stats.record_render(self, render, *args, **kwargs)
+    return wrapper
+
+
+def instrumented_into(render_into):
+    """
+    Decorator for the render_into functions of the components, see instrumented().
+    """
+    @functools.wraps(render_into)
+    def wrapper(self, buffer):
+        stats = _render_stats.get()
+        if stats is None:
+            return render_into(self, buffer)
+        return stats.record_render_into(self, render_into, buffer)
+    return wrapper
+
+
+def record_template_lookup(component):
+    """
+    Counts a template lookup of the component, if statistics are collected in the current context.
+
+    :param component: the component which renders a template
+    :return: None
+    """
+    stats = _render_stats.get()
+    if stats is not None:
+        stats.record_template_lookup(component)
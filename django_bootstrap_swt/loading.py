@@ -0,0 +1,57 @@
+from pathlib import Path
+from django.conf import settings
+from django.template.loader import get_template
+
+TEMPLATE_ROOT = Path(__file__).resolve().parent / 'templates'
+PACKAGE_TEMPLATE_DIR = 'django_bootstrap_swt'
+
+# the resolved templates of the components by template name
+_templates = {}
+
+
+def get_component_template(template_name: str):
+    """
+    Returns the resolved template with the given name. The template is searched only once and pinned until the
+    templates change, so the template loaders are skipped even if the cached loader is not used.
+
+    :param template_name: the name of the template
+    :return: the template of the configured template backend
+    """
+    try:
+        return _templates[template_name]
+    except KeyError:
+        template = _templates[template_name] = get_template(template_name)
+        return template
+
+
+def clear_component_templates(**kwargs):
+    """
+    Drops all pinned templates. Connected to the autoreload file_changed and to the setting_changed signal.
+
+    :return: None, so django's own template reset on file changes is not influenced
+    """
+    _templates.clear()
+
+
+def clear_on_templates_setting_changed(setting: str, **kwargs):
+    if setting == 'TEMPLATES':
+        clear_component_templates()
+
+
+def warm_up_templates() -> [str]:
+    """
+    Resolves and compiles all templates of this package. The templates are searched by their name, so overridden
+    templates of the project are used like on rendering.
+
+    :return: the names of the warmed up templates
+    """
+    template_names = sorted(path.relative_to(TEMPLATE_ROOT).as_posix()
+                            for path in (TEMPLATE_ROOT / PACKAGE_TEMPLATE_DIR).rglob('*.html'))
+    for template_name in template_names:
+        get_component_template(template_name)
+    return template_names
+
+
+def warm_up_enabled() -> bool:
+    """:returns True if the templates shall be warmed up on startup, configured by BOOTSTRAP_SWT_WARM_UP_TEMPLATES"""
+    return getattr(settings, 'BOOTSTRAP_SWT_WARM_UP_TEMPLATES', False)
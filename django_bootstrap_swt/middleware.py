@@ -0,0 +1,61 @@
+import hashlib
+import logging
+from django.utils.functional import SimpleLazyObject
+from django_bootstrap_swt.ids import id_namespace
+from django_bootstrap_swt.instrumentation import collect_render_stats
+from django_bootstrap_swt.utils import get_render_helper
+
+logger = logging.getLogger('django_bootstrap_swt')
+
+
+class IdFactoryMiddleware:
+    """
+    This middleware generates sequential ids for all components which are constructed while handling a request. The
+    namespace of the ids is derived from the requested path, so the ids are stable over requests of the same url and
+    don't collide with the ids of fragments which are fetched from another url.
+    """
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    @staticmethod
+    def get_namespace(request) -> str:
+        """:returns the namespace of the ids for the given request"""
+        return hashlib.blake2s(request.get_full_path().encode('utf-8'), digest_size=4).hexdigest()
+
+    def __call__(self, request):
+        with id_namespace(namespace=self.get_namespace(request)):
+            return self.get_response(request)
+
+
+class RenderStatsMiddleware:
+    """
+    This middleware collects the render statistics of all components per request. The totals are emitted as
+    Server-Timing header and logged with debug level. Inside of the view the statistics are available as
+    request.swt_render_stats. Components which are rendered while a streaming response is consumed are not counted.
+    """
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with collect_render_stats() as stats:
+            request.swt_render_stats = stats
+            response = self.get_response(request)
+        server_timing = stats.server_timing()
+        if response.has_header('Server-Timing'):
+            server_timing = response['Server-Timing'] + ', ' + server_timing
+        response['Server-Timing'] = server_timing
+        logger.debug("rendered components for %s: %s", request.path, stats.as_dict())
+        return response
+
+
+class RenderHelperMiddleware:
+    """
+    This middleware adds a lazy request.render_helper, which is built once per request from request.user. It needs to
+    be placed after django's AuthenticationMiddleware.
+    """
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        request.render_helper = SimpleLazyObject(lambda: get_render_helper(request))
+        return self.get_response(request)
@@ -0,0 +1,73 @@
+from abc import ABC, abstractmethod
+
+
+class PermissionExpression(ABC):
+    """
+    This is the base class for compiled permission expressions, which can be used as needs_perm of a component. An
+    expression is evaluated against the frozenset of user permission codenames of the RenderHelper. Members of an
+    expression are permission codenames or other expressions.
+    """
+    __slots__ = ('permissions', )
+
+    def __init__(self, *permissions):
+        """
+        :param permissions: the permission codenames or nested expressions
+        """
+        self.permissions = frozenset(permissions)
+
+    def __eq__(self, other) -> bool:
+        return type(self) is type(other) and self.permissions == other.permissions
+
+    def __hash__(self) -> int:
+        return hash((type(self), self.permissions))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({', '.join(sorted(repr(permission) for permission in self.permissions))})"
+
+    @staticmethod
+    def _check(permission, user_permissions: frozenset) -> bool:
+        if isinstance(permission, str):
+            return permission in user_permissions
+        return permission(user_permissions)
+
+    @abstractmethod
+    def __call__(self, user_permissions: frozenset) -> bool:
+        """:returns True if the given user permissions fulfill this expression"""
+
+
+class AnyOf(PermissionExpression):
+    """
+    The user needs at least one of the permissions.
+    """
+    __slots__ = ()
+
+    def __call__(self, user_permissions: frozenset) -> bool:
+        return any(self._check(permission, user_permissions) for permission in self.permissions)
+
+
+class AllOf(PermissionExpression):
+    """
+    The user needs all of the permissions.
+    """
+    __slots__ = ()
+
+    def __call__(self, user_permissions: frozenset) -> bool:
+        return all(self._check(permission, user_permissions) for permission in self.permissions)
+
+
+def check_permission(needs_perm, user_permissions: frozenset) -> bool:
+    """
+    Evaluates a permission requirement.
+
+    :param needs_perm: a permission codename | a list, tuple or set of codenames which are all needed |
+                       a PermissionExpression | any callable, e.g. for object level permissions, which gets the
+                       user permissions and returns a bool
+    :param user_permissions: the frozenset of user permission codenames
+    :return: True if the requirement is fulfilled
+    """
+    if isinstance(needs_perm, str):
+        return needs_perm in user_permissions
+    if isinstance(needs_perm, (list, tuple, set, frozenset)):
+        # nested lists are unhashable, so they are checked one by one instead of building an AllOf expression
+        return all(check_permission(permission, user_permissions) for permission in needs_perm)
+    return bool(needs_perm(user_permissions))
@@ -1,5 +1,103 @@
+// fetched contents of components with a data-cache-ttl attribute and prefetched contents, by url
+const djangoBootstrapSwtCache = {};
+// running requests by url; identical requests of several components share one request
+const djangoBootstrapSwtRequests = {};
+// seconds a prefetched content is kept for components without a data-cache-ttl attribute
+const DJANGO_BOOTSTRAP_SWT_PREFETCH_TTL = 30;
+
+function getCachedFragment( fetch_url ) {
+    const entry = djangoBootstrapSwtCache[fetch_url];
+    if ( entry && entry.expires > Date.now() ){
+        if ( entry.once ){
+            delete djangoBootstrapSwtCache[fetch_url];
+        }
+        return entry.data;
+    }
+    delete djangoBootstrapSwtCache[fetch_url];
+    return undefined;
+}
+
+function consumePrefetchedFragment( fetch_url ) {
+    // a prefetched content which is rendered from the running request is not used again
+    const entry = djangoBootstrapSwtCache[fetch_url];
+    if ( entry && entry.once ){
+        delete djangoBootstrapSwtCache[fetch_url];
+    }
+}
+
+function fetchFragment( fetch_url, cache_ttl ) {
+    var entry = djangoBootstrapSwtRequests[fetch_url];
+    if ( !entry ){
+        entry = { request: $.ajax({ url: fetch_url }), waiters: 0 };
+        djangoBootstrapSwtRequests[fetch_url] = entry;
+        entry.request.always(function() {
+            delete djangoBootstrapSwtRequests[fetch_url];
+        });
+    }
+    if ( cache_ttl > 0 ){
+        entry.request.done(function( data ) {
+            djangoBootstrapSwtCache[fetch_url] = { data: data, expires: Date.now() + cache_ttl * 1000 };
+        });
+    }
+    entry.waiters += 1;
+    return entry.request;
+}
+
+function releaseFragment( fetch_url ) {
+    // aborts the request if no other component waits for it
+    const entry = djangoBootstrapSwtRequests[fetch_url];
+    if ( entry ){
+        entry.waiters -= 1;
+        if ( entry.waiters <= 0 ){
+            entry.request.abort();
+        }
+    }
+}
+
+function prefetchFragment( target ) {
+    const fetch_url = target.getAttribute('data-url');
+    // the cache entry is only looked at, getCachedFragment() would consume a prefetched content
+    const cached = djangoBootstrapSwtCache[fetch_url];
+    if ( !fetch_url || djangoBootstrapSwtRequests[fetch_url] || ( cached && cached.expires > Date.now() ) ){
+        return;
+    }
+    const cache_ttl = parseInt( target.getAttribute('data-cache-ttl') ) || 0;
+    const request = fetchFragment( fetch_url, cache_ttl );
+    if ( cache_ttl <= 0 ){
+        request.done(function( data ) {
+            djangoBootstrapSwtCache[fetch_url] = {
+                data: data, expires: Date.now() + DJANGO_BOOTSTRAP_SWT_PREFETCH_TTL * 1000, once: true
+            };
+        });
+    }
+}
+
+function prefetchOnIntent( event ) {
+    // the toggle button of a modal or collapse with data-prefetch="hover" is hovered or focused
+    const selector = event.currentTarget.getAttribute('data-target');
+    if ( selector ){
+        $( selector ).filter('[data-url][data-prefetch="hover"]').each(function() {
+            prefetchFragment( this );
+        });
+    }
+}
+
+function prefetchOnIdle() {
+    const prefetch = function() {
+        $('[data-url][data-prefetch="idle"]').each(function() {
+            prefetchFragment( this );
+        });
+    };
+    if ( window.requestIdleCallback ){
+        window.requestIdleCallback( prefetch );
+    } else {
+        setTimeout( prefetch, 1000 );
+    }
+}
+
 function bootstrapComponentAjaxCall( target, target_body , modal) {
     var fetch_url = target.attributes.getNamedItem('data-url').value;
+    var cache_ttl = parseInt( $( target ).attr('data-cache-ttl') ) || 0;
     var tooltips = $('[data-toggle="tooltip"]', target);
     const spinner = target_body.children(".django-bootstrap-swt-spinner");
     const error = target_body.closest(".django-bootstrap-swt-error");
@@ -8,46 +106,98 @@ function bootstrapComponentAjaxCall( target, target_body , modal) {
         target_body = $(".modal-fetched-content", target_body);
     }
 
-    tooltips.tooltip("hide");
-    $.ajax({
-      url: fetch_url,
-      beforeSend: function() {
-        spinner.removeClass("d-none");
-      },
-      success: function( data ) {
+    function render( data ) {
         spinner.addClass("d-none");
         error.addClass("d-none");
         target_body.html( data );
-        tooltips.tooltip();
-        initAjaxComponents(target);
-      },
-      error: function() {
-        spinner.addClass("d-none");
-        error.removeClass("d-none");
-      },
+        // the handlers of fetched components are delegated to the document, only their tooltips need to be set up
+        $('[data-toggle="tooltip"]', target_body).tooltip();
+    }
+
+    tooltips.tooltip("hide");
+    const cached = getCachedFragment( fetch_url );
+    if ( cached !== undefined ){
+        render( cached );
+        return;
+    }
+    if ( $( target ).data('swt-pending') === fetch_url ){
+        // the request of the last open is still running
+        return;
+    }
+    $( target ).data('swt-pending', fetch_url);
+    spinner.removeClass("d-none");
+    fetchFragment( fetch_url, cache_ttl ).done(function( data ) {
+        if ( $( target ).data('swt-pending') === fetch_url ){
+            $( target ).removeData('swt-pending');
+            consumePrefetchedFragment( fetch_url );
+            render( data );
+        }
+    }).fail(function( jqXHR, textStatus ) {
+        if ( $( target ).data('swt-pending') === fetch_url ){
+            $( target ).removeData('swt-pending');
+            spinner.addClass("d-none");
+            if ( textStatus !== "abort" ){
+                error.removeClass("d-none");
+            }
+        }
     });
 }
 
-function modalAjaxInit( parent ) {
-    $(".modal[data-url]", parent).on('shown.bs.modal', function( event ) {
+function bootstrapComponentAjaxAbort( target ) {
+    // the component was closed before the response arrived
+    const fetch_url = $( target ).data('swt-pending');
+    if ( fetch_url ){
+        $( target ).removeData('swt-pending');
+        $( target ).find(".django-bootstrap-swt-spinner").addClass("d-none");
+        releaseFragment( fetch_url );
+    }
+}
+
+function modalShown( event ) {
+    // shown events of nested components bubble up to this modal
+    if ( event.target === event.currentTarget ){
         bootstrapComponentAjaxCall( event.currentTarget, $( '.modal-content', event.currentTarget ), true );
-    });
-    $(".modal[data-url", parent).on('hidden.bs.modal', function( event ){
+    }
+}
+
+function modalHidden( event ) {
+    if ( event.target === event.currentTarget ){
+        bootstrapComponentAjaxAbort( event.currentTarget );
         $('.modal-fetched-content', event.currentTarget).html("");
-    });
+    }
 }
 
-function collapseAjaxInit( parent ) {
-    $(".collapse[data-url]", parent).on('shown.bs.collapse', function( event ) {
-        bootstrapComponentAjaxCall( event.target, $( event.target ), false );
-    });
+function collapseShown( event ) {
+    if ( event.target === event.currentTarget ){
+        bootstrapComponentAjaxCall( event.currentTarget, $( event.currentTarget ), false );
+    }
 }
 
-function initAjaxComponents( parent ) {
-    modalAjaxInit( parent );
-    collapseAjaxInit( parent );
+function collapseHidden( event ) {
+    if ( event.target === event.currentTarget ){
+        bootstrapComponentAjaxAbort( event.currentTarget );
+    }
+}
+
+var djangoBootstrapSwtInitWarned = false;
+
+function initAjaxComponents() {
+    // deprecated: the handlers are delegated to the document, so they also cover components which are added later,
+    // like fetched content, without any initialisation. The function only warns once and will be removed.
+    if ( !djangoBootstrapSwtInitWarned ){
+        djangoBootstrapSwtInitWarned = true;
+        console.warn("django-bootstrap-swt: initAjaxComponents() is deprecated and does nothing, " +
+                     "the ajax components are handled without initialisation.");
+    }
 }
 
+$( document )
+    .on('shown.bs.modal', '.modal[data-url]', modalShown)
+    .on('hidden.bs.modal', '.modal[data-url]', modalHidden)
+    .on('shown.bs.collapse', '.collapse[data-url]', collapseShown)
+    .on('hidden.bs.collapse', '.collapse[data-url]', collapseHidden)
+    .on('mouseover focusin', '[data-toggle="modal"], [data-toggle="collapse"]', prefetchOnIntent);
+
 $( document ).ready( function(){
-    initAjaxComponents( document );
-});
\ No newline at end of file
+    prefetchOnIdle();
+});
@@ -0,0 +1,8 @@
+from django.urls import path
+from django_bootstrap_swt.views import fetch_fragment_view
+
+app_name = 'django_bootstrap_swt'
+
+urlpatterns = [
+    path('fragments/<slug:name>/', fetch_fragment_view, name='fetch_fragment'),
+]
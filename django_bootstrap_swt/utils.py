@@ -1,11 +1,20 @@
+import copy
+from collections import OrderedDict
+from itertools import islice
 from urllib import parse
+from asgiref.sync import sync_to_async
 from django_bootstrap_swt.components import BootstrapComponent, Modal
+from django_bootstrap_swt.permissions import check_permission
 
 
 class RenderHelper:
     """
     This class provides some functions for permission checked rendering.
     """
+    # maximum number of updated hrefs which are memoized per helper
+    HREF_CACHE_SIZE = 4096
+    # number of items which are rendered per sync_to_async call of the async functions
+    ASYNC_BATCH_SIZE = 100
     def __init__(self, user_permissions: [str] = None, update_url_qs: dict = None, update_attrs: dict = None):
         """
         :param user_permissions: a list which holds all user permission codenames
@@ -15,25 +24,109 @@ class RenderHelper:
         self.user_permissions = user_permissions if user_permissions else []
         self.update_url_qs = update_url_qs
         self.update_attrs = update_attrs
+        # the set of user permissions, the user_permissions it was built from and the results of the already
+        # evaluated permission requirements
+        self._user_permission_set = frozenset(self.user_permissions)
+        self._permissions_from = list(self.user_permissions)
+        self._permission_results = {}
+        # the encoded update of the query, the update_url_qs it was encoded from and the updated hrefs, which are
+        # memoized per helper with the least recently used href evicted first
+        self._encoded_url_qs = {}
+        self._encoded_from = {}
+        self._href_cache = OrderedDict()
+
+    @classmethod
+    def from_user(cls, user, **kwargs):
+        """
+        Builds a RenderHelper with all permissions of the given user. Every permission is added as codename and as
+        app_label.codename.
+
+        :param user: the django user
+        :param kwargs: Optional: the other arguments of the RenderHelper
+        :return: the RenderHelper
+        """
+        user_permissions = []
+        for permission in user.get_all_permissions():
+            user_permissions.append(permission)
+            user_permissions.append(permission.split('.', 1)[-1])
+        return cls(user_permissions=user_permissions, **kwargs)
 
     def _check_render_permission(self, item: BootstrapComponent) -> bool:
-        if not item.needs_perm or self.user_permissions and item.needs_perm in self.user_permissions:
+        needs_perm = item.needs_perm
+        if not needs_perm:
             return True
-        else:
-            return False
+        user_permission_set = self._get_user_permission_set()
+        try:
+            key = frozenset(needs_perm) if isinstance(needs_perm, (list, tuple, set)) else needs_perm
+            return self._permission_results[key]
+        except KeyError:
+            has_perm = self._permission_results[key] = check_permission(key, user_permission_set)
+            return has_perm
+        except TypeError:
+            # unhashable requirements can't be memoized
+            return check_permission(needs_perm, user_permission_set)
+
+    def _get_user_permission_set(self) -> frozenset:
+        # user_permissions is public, so the set is built again if it was replaced or changed since it was built
+        user_permissions = self.user_permissions or []
+        if self._permissions_from != user_permissions:
+            self._permissions_from = list(user_permissions)
+            self._user_permission_set = frozenset(self._permissions_from)
+            self._permission_results.clear()
+        return self._user_permission_set
+
+    def _get_encoded_url_qs(self) -> dict:
+        # update_url_qs is public, so it is encoded again if it was replaced or changed since it was encoded
+        if self._encoded_from != self.update_url_qs:
+            self._encoded_from = copy.deepcopy(self.update_url_qs)
+            self._encoded_url_qs = {str(key): parse.urlencode({key: value}, doseq=True)
+                                    for key, value in self.update_url_qs.items()} if self.update_url_qs else {}
+            self._href_cache.clear()
+        return self._encoded_url_qs
+
+    def _update_href(self, href: str) -> str:
+        encoded_url_qs = self._get_encoded_url_qs()
+        try:
+            self._href_cache.move_to_end(href)
+            return self._href_cache[href]
+        except KeyError:
+            pass
+        updated_href = self._href_cache[href] = self._build_href(href, encoded_url_qs)
+        if len(self._href_cache) > self.HREF_CACHE_SIZE:
+            self._href_cache.popitem(last=False)
+        return updated_href
+
+    @staticmethod
+    def _build_href(href: str, encoded_url_qs: dict) -> str:
+        url, hash_mark, fragment = href.partition('#')
+        url, _, query = url.partition('?')
+        missing_url_qs = dict(encoded_url_qs)
+        params = []
+        for param in query.split('&'):
+            if not param:
+                continue
+            key = parse.unquote_plus(param.partition('=')[0])
+            if key in encoded_url_qs:
+                # the first occurrence is replaced in place, repeated occurrences are dropped
+                param = missing_url_qs.pop(key, None)
+                if param is None:
+                    continue
+            params.append(param)
+        params.extend(missing_url_qs.values())
+        if params:
+            url = f"{url}?{'&'.join(params)}"
+        return f"{url}{hash_mark}{fragment}"
 
     def update_queryparams(self, item: BootstrapComponent):
         """
-        Updates the query string of a given url
+        Updates the query string of a given url. Keys of update_url_qs replace the existing values in place, all other
+        parameters of the url are kept as they are, even if they occur multiple times. The given item is not changed.
+
         :param item: the BootstrapComponent to update
-        :return: the updated item
+        :return: a copy of the item with the updated url | the item itself if it has no url
         """
         if hasattr(item, 'attrs') and 'href' in item.attrs:
-            url_parts = list(parse.urlparse(item.attrs['href'][0]))
-            query = dict(parse.parse_qsl(url_parts[4]))
-            query.update(self.update_url_qs)
-            url_parts[4] = parse.urlencode(query)
-            item.attrs['href'] = [parse.urlunparse(url_parts)]
+            return item.with_attributes(href=self._update_href(item.attrs['href'][0]))
         return item
 
     def render_item(self, item, safe: bool = False) -> str:
@@ -42,23 +135,45 @@ class RenderHelper:
         value will be checked against the self.user_permissions list. If the needs_perm attribute value is not
         in the self.user_permissions list, the item will not be rendered.
 
+        The updates of update_url_qs and update_attrs are applied to a shallow copy of the item, so the item itself is
+        not changed and can be shared between requests and threads.
+
         :param item: the BoostrapComponent which will be rendered or not
-        :param safe: switches if the rendered component is returned as SafeString or str
+        :param safe: passed to the render() function of the item, which always returns SafeHtml
         :return: empty string if the user does not have the right permission |
                  the rendered BootstrapComponent if the user does have the permission
         """
         rendered_string = ''
         if self._check_render_permission(item):
-            if self.update_url_qs:
-                self.update_queryparams(item=item)
-            if self.update_attrs:
-                if isinstance(item, Modal):
-                    item.button.update_attributes(update_attrs=self.update_attrs)
-                else:
-                    item.update_attributes(update_attrs=self.update_attrs)
-            rendered_string = item.render(safe=safe)
+            rendered_string = self._prepare_item(item=item).render(safe=safe)
         return rendered_string
 
+    def _prepare_item(self, item: BootstrapComponent) -> BootstrapComponent:
+        if isinstance(item, Modal):
+            if self.update_attrs:
+                modal = copy.copy(item)
+                modal.button = item.button.with_attributes(update_attrs=self.update_attrs)
+                return modal
+            return item
+        if not hasattr(item, 'attrs'):
+            return item
+        href = None
+        if self.update_url_qs and 'href' in item.attrs:
+            href = self._update_href(item.attrs['href'][0])
+        if href is None and not self.update_attrs:
+            return item
+        return item.with_attributes(update_attrs=self.update_attrs, href=href)
+
+    def iter_item(self, item: BootstrapComponent):
+        """
+        Streaming variant of render_item(). Yields nothing if the user does not have the right permission.
+
+        :param item: the BoostrapComponent which will be rendered or not
+        :return: a generator which yields the rendered BootstrapComponent as string chunks
+        """
+        if self._check_render_permission(item):
+            yield from self._prepare_item(item=item).iter_render()
+
     def render_list_coherent(self, items: [], safe: bool = False) -> str:
         """
         Use this function to render a list of items based on the self.user_permissions list. All items which needs
@@ -66,11 +181,79 @@ class RenderHelper:
         in the self.user_permissions list, the item will not be rendered and concatenated.
 
         :param items: the list of BootstrapComponent which shall be rendered
-        :param safe: Optional: switches if the rendered component is returned as SafeString or str
+        :param safe: Optional: passed to the render() function of the items
         :return: empty string if the user does not have the right permissions for any item |
                  the concatenated string with all rendered items for that the user has permissions
         """
-        rendered_string = ''
+        return ''.join([self.render_item(item=item, safe=safe) for item in items])
+
+    def iter_list(self, items: []):
+        """
+        Streaming variant of render_list_coherent(). Items are rendered one after another while the returned generator
+        is consumed, so it can be passed to django's StreamingHttpResponse directly.
+
+        :param items: the iterable of BootstrapComponent which shall be rendered
+        :return: a generator which yields the rendered items as string chunks for that the user has permissions
+        """
         for item in items:
-            rendered_string += self.render_item(item=item, safe=safe)
-        return rendered_string
+            yield from self.iter_item(item=item)
+
+    def _render_batch(self, items, batch_size: int, safe: bool = False):
+        batch = list(islice(items, batch_size))
+        if not batch:
+            return None
+        return ''.join([self.render_item(item=item, safe=safe) for item in batch])
+
+    async def arender_item(self, item: BootstrapComponent, safe: bool = False) -> str:
+        """
+        Async variant of render_item(). The item is rendered in a worker thread, so the event loop is not blocked.
+
+        :param item: the BoostrapComponent which will be rendered or not
+        :param safe: passed to the render() function of the item, which always returns SafeHtml
+        :return: empty string if the user does not have the right permission |
+                 the rendered BootstrapComponent if the user does have the permission
+        """
+        return await sync_to_async(self.render_item)(item=item, safe=safe)
+
+    async def arender_list(self, items: [], safe: bool = False) -> str:
+        """
+        Async variant of render_list_coherent(). All items are rendered with one sync_to_async call.
+
+        :param items: the list of BootstrapComponent which shall be rendered
+        :param safe: Optional: passed to the render() function of the items
+        :return: the concatenated string with all rendered items for that the user has permissions
+        """
+        return await sync_to_async(self.render_list_coherent)(items=items, safe=safe)
+
+    async def aiter_list(self, items: [], batch_size: int = None):
+        """
+        Async streaming variant of iter_list(), for example to use it with django's StreamingHttpResponse under ASGI.
+        The items are rendered in batches of batch_size items per sync_to_async call.
+
+        :param items: the iterable of BootstrapComponent which shall be rendered
+        :param batch_size: Optional: the number of items per batch. Default is self.ASYNC_BATCH_SIZE
+        :return: an async generator which yields the rendered batches as string chunks
+        """
+        items = iter(items)
+        render_batch = sync_to_async(self._render_batch)
+        while True:
+            chunk = await render_batch(items, batch_size or self.ASYNC_BATCH_SIZE)
+            if chunk is None:
+                return
+            if chunk:
+                yield chunk
+
+
+def get_render_helper(request) -> RenderHelper:
+    """
+    Returns the RenderHelper of the request. It is built once per request from request.user, so the permissions of the
+    user are loaded only once, no matter how many components are rendered.
+
+    :param request: the current request
+    :return: the RenderHelper of the request
+    """
+    try:
+        return request._swt_render_helper
+    except AttributeError:
+        request._swt_render_helper = RenderHelper.from_user(request.user)
+        return request._swt_render_helper
@@ -0,0 +1,167 @@
+import hashlib
+from calendar import timegm
+from urllib.parse import urlencode
+from django.core.cache import caches
+from django.http import Http404, HttpResponse
+from django.urls import reverse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
+from django.utils.translation import get_language
+from django.views.decorators.http import require_safe
+from django_bootstrap_swt.cache import KEY_PREFIX
+from django_bootstrap_swt.components import BootstrapComponent
+
+# the registered fetch fragments by name
+_fetch_fragments = {}
+
+
+class FetchFragment:
+    """
+    This class describes a fragment which is fetched by the fetch_url of Modal, Accordion or CardBody and served by
+    fetch_fragment_view.
+    """
+    def __init__(self, name: str, render, last_modified=None, cache_timeout: int = None, cache_alias: str = 'default',
+                 vary_on_user: bool = True):
+        """
+        :param name: the unique name of the fragment, which is part of the url
+        :param render: a callable which gets the request and returns the fragment as string or BootstrapComponent
+        :param last_modified: Optional: a callable which gets the request and returns the datetime of the last
+                              modification of the fragment content | None if it is unknown. It is called before the
+                              fragment is rendered, so conditional requests are answered without rendering.
+        :param cache_timeout: Optional: the number of seconds to cache the rendered fragment on the server side.
+                              Default is no server side caching.
+        :param cache_alias: Optional: the alias of the django cache to use
+        :param vary_on_user: Optional: if True, the cached fragment is stored per user and the browser may cache the
+                             response only privately
+        """
+        self.name = name
+        self.render = render
+        self.last_modified = last_modified
+        self.cache_timeout = cache_timeout
+        self.cache_alias = cache_alias
+        self.vary_on_user = vary_on_user
+
+    def get_cache_key(self, request, last_modified: int = None) -> str:
+        """:returns the key of the rendered fragment for the given request in the django cache"""
+        parts = [self.name, sorted(request.GET.lists()), get_language(), last_modified]
+        if self.vary_on_user:
+            user = getattr(request, 'user', None)
+            parts.append(getattr(user, 'pk', None))
+        return f"{KEY_PREFIX}.fetch.{hashlib.sha256(repr(parts).encode('utf-8')).hexdigest()}"
+
+    def get_content(self, request, last_modified: int = None) -> (bytes, str):
+        """
+        Renders the fragment or gets it from the server side cache.
+
+        :param request: the current request
+        :param last_modified: Optional: the timestamp of the last modification of the fragment content
+        :return: the rendered fragment as utf-8 encoded bytes and its strong ETag
+        """
+        if self.cache_timeout is None:
+            return self._render(request)
+        cache = caches[self.cache_alias]
+        key = self.get_cache_key(request, last_modified=last_modified)
+        entry = cache.get(key)
+        if entry is None:
+            entry = self._render(request)
+            cache.set(key, entry, self.cache_timeout)
+        return entry
+
+    def get_cached_etag(self, request, last_modified: int = None):
+        """
+        Looks up the ETag of the fragment in the server side cache without rendering it.
+
+        :param request: the current request
+        :param last_modified: Optional: the timestamp of the last modification of the fragment content
+        :return: the strong ETag of the cached fragment | None if the fragment is not cached on the server side
+        """
+        if self.cache_timeout is None:
+            return None
+        entry = caches[self.cache_alias].get(self.get_cache_key(request, last_modified=last_modified))
+        return entry[1] if entry is not None else None
+
+    def _render(self, request) -> (bytes, str):
+        rendered = self.render(request)
+        if isinstance(rendered, BootstrapComponent):
+            rendered = rendered.render()
+        content = rendered.encode('utf-8')
+        return content, f'"{hashlib.sha256(content).hexdigest()[:32]}"'
+
+
+def register_fetch_fragment(name: str, last_modified=None, cache_timeout: int = None, cache_alias: str = 'default',
+                            vary_on_user: bool = True):
+    """
+    Decorator to register a function, which gets the request and returns a fragment, as fetch fragment. The url of the
+    fragment is returned by fetch_fragment_url(name). See FetchFragment for the arguments.
+
+    :return: the decorator, which returns the decorated function unchanged
+    """
+    def decorator(render):
+        _fetch_fragments[name] = FetchFragment(name=name, render=render, last_modified=last_modified,
+                                               cache_timeout=cache_timeout, cache_alias=cache_alias,
+                                               vary_on_user=vary_on_user)
+        return render
+    return decorator
+
+
+def get_fetch_fragment(name: str) -> FetchFragment:
+    """:returns the registered fetch fragment with the given name
+    :raises KeyError: if no fetch fragment with the given name is registered
+    """
+    return _fetch_fragments[name]
+
+
+def fetch_fragment_url(name: str, **query) -> str:
+    """
+    Returns the url of a registered fetch fragment, for example to use it as fetch_url of a Modal.
+
+    :param name: the name of the registered fetch fragment
+    :param query: Optional: the query parameters, which are available as request.GET in the render function
+    :return: the url of the fragment
+    """
+    url = reverse('django_bootstrap_swt:fetch_fragment', kwargs={'name': name})
+    if query:
+        url += '?' + urlencode(query, doseq=True)
+    return url
+
+
+@require_safe
+def fetch_fragment_view(request, name: str):
+    """
+    Serves a registered fetch fragment with a strong ETag and, if the fragment provides it, a Last-Modified header.
+    Conditional requests are answered with 304 Not Modified. A request which is answered by its If-Modified-Since
+    header is answered without rendering the fragment, so the 304 contains the ETag only if the fragment is cached on
+    the server side.
+    """
+    try:
+        fragment = get_fetch_fragment(name)
+    except KeyError:
+        raise Http404(f"fetch fragment '{name}' is not registered")
+
+    last_modified = None
+    if fragment.last_modified is not None:
+        modified = fragment.last_modified(request)
+        if modified is not None:
+            last_modified = timegm(modified.utctimetuple())
+    if last_modified is not None and 'HTTP_IF_NONE_MATCH' not in request.META:
+        response = get_conditional_response(request, last_modified=last_modified)
+        if response is not None:
+            etag = fragment.get_cached_etag(request, last_modified=last_modified)
+            return _finalize(fragment, response, etag=etag, last_modified=last_modified)
+
+    content, etag = fragment.get_content(request, last_modified=last_modified)
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is None:
+        response = HttpResponse(content)
+    return _finalize(fragment, response, etag=etag, last_modified=last_modified)
+
+
+def _finalize(fragment: FetchFragment, response, etag: str = None, last_modified: int = None):
+    if etag is not None:
+        response['ETag'] = etag
+    if last_modified is not None:
+        response['Last-Modified'] = http_date(last_modified)
+    # the browser may keep the fragment, but needs to revalidate it with a conditional request
+    # private=False would be serialized as a directive, so it is only passed for fragments which vary on the user
+    patch_cache_control(response, no_cache=True, **({'private': True} if fragment.vary_on_user else {}))
+    return response
@@ -45,3 +45,232 @@ QUnit.test("bootstrapComponentAjaxCall adds response content to target_body", fu
        done();
     }, 1000);
 });
+
+var requests;
+var original_ajax;
+
+function clearAjaxState() {
+    Object.keys( djangoBootstrapSwtCache ).forEach(function( fetch_url ) {
+        delete djangoBootstrapSwtCache[fetch_url];
+    });
+    Object.keys( djangoBootstrapSwtRequests ).forEach(function( fetch_url ) {
+        delete djangoBootstrapSwtRequests[fetch_url];
+    });
+}
+
+function stubbedAjax( options ) {
+    // the request is recorded and answered by the test with respond() or abort()
+    const deferred = $.Deferred();
+    const request = deferred.promise();
+    request.url = options.url;
+    request.aborted = false;
+    request.respond = function( data ) {
+        deferred.resolve( data, "success", request );
+    };
+    request.abort = function() {
+        request.aborted = true;
+        deferred.reject( request, "abort" );
+    };
+    requests.push( request );
+    return request;
+}
+
+function showModal() {
+    $( "#id_ajax_modal" ).trigger('shown.bs.modal');
+}
+
+function hideModal() {
+    $( "#id_ajax_modal" ).trigger('hidden.bs.modal');
+}
+
+QUnit.module('django-bootstrap-swt ajax runtime', {
+    beforeEach: function() {
+        $.ajax({
+            type: "GET",
+            url : "ajax-components.html",
+            dataType: "html",
+            async: false,
+            success : function (data) {
+                $("#qunit-fixture").html(data);
+            }
+        });
+        clearAjaxState();
+        requests = [];
+        original_ajax = $.ajax;
+        $.ajax = stubbedAjax;
+    },
+    afterEach: function() {
+        $.ajax = original_ajax;
+        clearAjaxState();
+    }
+});
+
+QUnit.test("content with data-cache-ttl is fetched once while it is cached", function(assert) {
+    $( "#id_ajax_modal" ).attr('data-cache-ttl', '60');
+
+    showModal();
+    requests[0].respond('Hello');
+    hideModal();
+    showModal();
+
+    assert.equal(requests.length, 1);
+    assert.equal($( "#id_ajax_modal .modal-fetched-content" ).text(), 'Hello');
+    assert.ok($( "#id_ajax_modal .django-bootstrap-swt-spinner" ).hasClass("d-none"));
+
+    djangoBootstrapSwtCache["modal-content.html"].expires = Date.now() - 1;
+    hideModal();
+    showModal();
+    assert.equal(requests.length, 2);
+});
+
+QUnit.test("content without data-cache-ttl is fetched on every open", function(assert) {
+    showModal();
+    requests[0].respond('Hello');
+    hideModal();
+    showModal();
+
+    assert.equal(requests.length, 2);
+});
+
+QUnit.test("identical running requests are shared", function(assert) {
+    $( "#id_ajax_collapse" ).attr('data-url', 'modal-content.html');
+
+    showModal();
+    showModal();
+    $( "#id_ajax_collapse" ).trigger('shown.bs.collapse');
+    assert.equal(requests.length, 1);
+
+    requests[0].respond('Hello');
+    assert.equal($( "#id_ajax_modal .modal-fetched-content" ).text(), 'Hello');
+    assert.equal($( "#id_ajax_collapse" ).text(), 'Hello');
+});
+
+QUnit.test("request is aborted when the component is closed before the response", function(assert) {
+    showModal();
+    assert.notOk($( "#id_ajax_modal .django-bootstrap-swt-spinner" ).hasClass("d-none"));
+
+    hideModal();
+    assert.ok(requests[0].aborted);
+    assert.ok($( "#id_ajax_modal .django-bootstrap-swt-spinner" ).hasClass("d-none"));
+    assert.ok($( "#id_ajax_modal .django-bootstrap-swt-error" ).hasClass("d-none"));
+
+    showModal();
+    assert.equal(requests.length, 2);
+});
+
+QUnit.test("shared request is not aborted while another component waits for it", function(assert) {
+    $( "#id_ajax_collapse" ).attr('data-url', 'modal-content.html');
+
+    showModal();
+    $( "#id_ajax_collapse" ).trigger('shown.bs.collapse');
+    hideModal();
+    assert.notOk(requests[0].aborted);
+
+    requests[0].respond('Hello');
+    assert.equal($( "#id_ajax_collapse" ).text(), 'Hello');
+});
+
+QUnit.test("hovered toggle prefetches the content, which is shown without spinner", function(assert) {
+    $( "#id_ajax_modal" ).attr('data-prefetch', 'hover');
+
+    $( "#id_modal_button" ).trigger('mouseover');
+    assert.equal(requests.length, 1);
+    requests[0].respond('Hello');
+    showModal();
+
+    assert.equal(requests.length, 1);
+    assert.equal($( "#id_ajax_modal .modal-fetched-content" ).text(), 'Hello');
+    assert.ok($( "#id_ajax_modal .django-bootstrap-swt-spinner" ).hasClass("d-none"));
+});
+
+QUnit.test("second hover does not consume the prefetched content", function(assert) {
+    $( "#id_ajax_modal" ).attr('data-prefetch', 'hover');
+
+    $( "#id_modal_button" ).trigger('mouseover');
+    requests[0].respond('Hello');
+    $( "#id_modal_button" ).trigger('mouseover');
+    $( "#id_modal_button" ).trigger('focusin');
+    showModal();
+
+    assert.equal(requests.length, 1);
+    assert.equal($( "#id_ajax_modal .modal-fetched-content" ).text(), 'Hello');
+});
+
+QUnit.test("open during a running prefetch waits for the prefetch and uses it once", function(assert) {
+    $( "#id_ajax_modal" ).attr('data-prefetch', 'hover');
+
+    $( "#id_modal_button" ).trigger('mouseover');
+    showModal();
+    assert.equal(requests.length, 1);
+
+    requests[0].respond('Hello');
+    assert.equal($( "#id_ajax_modal .modal-fetched-content" ).text(), 'Hello');
+    assert.ok($( "#id_ajax_modal .django-bootstrap-swt-spinner" ).hasClass("d-none"));
+
+    hideModal();
+    showModal();
+    assert.equal(requests.length, 2);
+});
+
+QUnit.test("components without data-prefetch are not prefetched", function(assert) {
+    $( "#id_modal_button" ).trigger('mouseover');
+    $( "#id_collapse_button" ).trigger('focusin');
+
+    assert.equal(requests.length, 0);
+});
+
+QUnit.test("components with data-prefetch idle are prefetched in idle time", function(assert) {
+    const original_request_idle_callback = window.requestIdleCallback;
+    $( "#id_ajax_collapse" ).attr('data-prefetch', 'idle');
+
+    window.requestIdleCallback = function( callback ) {
+        callback();
+    };
+    prefetchOnIdle();
+    window.requestIdleCallback = original_request_idle_callback;
+
+    assert.equal(requests.length, 1);
+    assert.equal(requests[0].url, 'collapse-content.html');
+});
+
+QUnit.test("fetched components are handled without initialisation", function(assert) {
+    showModal();
+    requests[0].respond('<div id="id_fetched_collapse" class="collapse" data-url="fetched-content.html"></div>');
+    $( "#id_fetched_collapse" ).trigger('shown.bs.collapse');
+
+    assert.equal(requests.length, 2);
+    assert.equal(requests[1].url, 'fetched-content.html');
+    requests[1].respond('Hello');
+    assert.equal($( "#id_fetched_collapse" ).text(), 'Hello');
+});
+
+QUnit.test("every open of a nested component causes exactly one request", function(assert) {
+    showModal();
+    requests[0].respond('<div id="id_nested_modal" class="modal" data-url="nested-content.html">' +
+                        '<div class="modal-content"><div class="modal-fetched-content"></div></div></div>');
+    $( "#id_nested_modal" ).trigger('shown.bs.modal');
+
+    assert.equal(requests.length, 2);
+    assert.equal(requests[1].url, 'nested-content.html');
+    requests[1].respond('Hello');
+
+    // the hidden event of the nested modal bubbles up, but does not clear the outer modal
+    $( "#id_nested_modal" ).trigger('hidden.bs.modal');
+    assert.equal($( "#id_nested_modal" ).length, 1);
+});
+
+QUnit.test("deprecated initAjaxComponents warns once and does not bind the handlers again", function(assert) {
+    const original_warn = console.warn;
+    var warnings = 0;
+    console.warn = function() {
+        warnings += 1;
+    };
+    djangoBootstrapSwtInitWarned = false;
+    initAjaxComponents( $( document ) );
+    initAjaxComponents( $( "#qunit-fixture" ) );
+    console.warn = original_warn;
+    showModal();
+
+    assert.equal(warnings, 1);
+    assert.equal(requests.length, 1);
+});
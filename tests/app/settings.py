@@ -6,6 +6,8 @@ INSTALLED_APPS = [
 
 SECRET_KEY = "this is super secret"
 
+ROOT_URLCONF = "tests.app.urls"
+
 TEMPLATES = [
     {
         "BACKEND": "django.template.backends.django.DjangoTemplates",
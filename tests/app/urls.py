@@ -0,0 +1,5 @@
+from django.urls import include, path
+
+urlpatterns = [
+    path('swt/', include('django_bootstrap_swt.urls')),
+]
@@ -0,0 +1,117 @@
+from unittest import TestCase
+from django.utils import translation
+from django.utils.safestring import SafeString
+from django_bootstrap_swt.cache import RenderCache, DjangoRenderCache, make_key
+from django_bootstrap_swt.components import Badge, Tag, Button, ListGroup, ListGroupItem, Modal
+from django_bootstrap_swt.enums import BadgeColorEnum
+
+
+class TestRenderCache(TestCase):
+    """ This class contains all needed tests for testing RenderCache class
+    """
+
+    def test_get_counts_hits_and_misses(self):
+        cache = RenderCache()
+        self.assertIsNone(cache.get('key'))
+        cache.set('key', 'value')
+        self.assertEqual(first='value', second=cache.get('key'))
+        self.assertEqual(first=1, second=cache.hits)
+        self.assertEqual(first=1, second=cache.misses)
+
+    def test_set_evicts_least_recently_used_entries(self):
+        entry_size = RenderCache._entry_size('key-1', 'value-1')
+        cache = RenderCache(max_bytes=entry_size * 2)
+        cache.set('key-1', 'value-1')
+        cache.set('key-2', 'value-2')
+        cache.get('key-1')
+        cache.set('key-3', 'value-3')
+
+        self.assertEqual(first=2, second=len(cache))
+        self.assertIsNone(cache.get('key-2'))
+        self.assertEqual(first='value-1', second=cache.get('key-1'))
+        self.assertLessEqual(a=cache.size, b=cache.max_bytes)
+
+    def test_set_skips_entries_bigger_than_max_bytes(self):
+        cache = RenderCache(max_bytes=10)
+        cache.set('key', 'value')
+        self.assertEqual(first=0, second=len(cache))
+        self.assertEqual(first=0, second=cache.size)
+
+    def test_key_depends_on_active_language(self):
+        structure = ('tag', 'span', (), 'content')
+        with translation.override('en'):
+            key_en = make_key(structure)
+        with translation.override('de'):
+            key_de = make_key(structure)
+        self.assertNotEqual(first=key_en, second=key_de)
+
+
+class TestComponentRenderCache(TestCase):
+    """ This class contains all needed tests for testing the render cache of the components
+    """
+
+    def setUp(self) -> None:
+        self.cache = RenderCache()
+        Tag.render_cache = self.cache
+
+    def tearDown(self) -> None:
+        Tag.render_cache = None
+
+    def test_identical_components_hit_the_cache(self):
+        first = Badge(content='1234', color=BadgeColorEnum.PRIMARY).render()
+        second = Badge(content='1234', color=BadgeColorEnum.PRIMARY).render()
+        self.assertEqual(first=first, second=second)
+        self.assertEqual(first=1, second=self.cache.hits)
+        self.assertEqual(first=1, second=self.cache.misses)
+
+    def test_different_attrs_miss_the_cache(self):
+        first = Badge(content='1234', color=BadgeColorEnum.PRIMARY).render()
+        second = Badge(content='1234', color=BadgeColorEnum.DANGER).render()
+        self.assertNotEqual(first=first, second=second)
+        self.assertEqual(first=0, second=self.cache.hits)
+
+    def test_cached_tooltip_output_is_correct(self):
+        first = Badge(content='1234', tooltip='nice tooltip').render()
+        second = Badge(content='1234').render()
+        Tag.render_cache = None
+        self.assertEqual(first=Badge(content='1234', tooltip='nice tooltip').render(), second=first)
+        self.assertEqual(first=Badge(content='1234').render(), second=second)
+
+    def test_key_covers_child_components(self):
+        item = ListGroupItem(content='nice item')
+        self.assertNotEqual(first=ListGroup(items=[item]).render_cache_key(),
+                            second=ListGroup(items=[ListGroupItem(content='other item')]).render_cache_key())
+        self.assertIsNone(ListGroup(items=[item, Modal(btn_content='nice button')]).render_cache_key())
+
+    def test_safe_strings_do_not_share_the_key_of_plain_strings(self):
+        safe = Tag(tag='span', attrs={'title': [SafeString('<b>')]})
+        plain = Tag(tag='span', attrs={'title': ['<b>']})
+        self.assertNotEqual(first=safe.render_cache_key(), second=plain.render_cache_key())
+        self.assertNotEqual(first=safe.render(), second=plain.render())
+
+    def test_uncacheable_values_are_rendered_without_cache(self):
+        tag = Tag(tag='span', attrs={'data-value': [object()]})
+        self.assertIsNone(tag.render_cache_key())
+        tag.render()
+        self.assertEqual(first=0, second=self.cache.hits + self.cache.misses)
+
+
+class TestDjangoRenderCache(TestCase):
+    """ This class contains all needed tests for testing DjangoRenderCache class
+    """
+
+    def setUp(self) -> None:
+        self.cache = DjangoRenderCache()
+        self.cache.backend.clear()
+        Button.render_cache = self.cache
+
+    def tearDown(self) -> None:
+        del Button.render_cache
+
+    def test_components_are_cached_in_backend(self):
+        button = Button(content='nice button')
+        first = button.render()
+        second = button.render()
+        self.assertEqual(first=first, second=second)
+        self.assertEqual(first=1, second=self.cache.hits)
+        self.assertEqual(first=1, second=self.cache.misses)
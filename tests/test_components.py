@@ -1,13 +1,18 @@
+import asyncio
+import io
 import uuid
 from unittest import TestCase
+from django.http import HttpResponse
 from django.template.loader import render_to_string
 from django.utils.safestring import SafeString
 from django_bootstrap_swt.components import BootstrapComponent, ProgressBar, Badge, Tooltip, \
     TooltipSurroundedComponent, Modal, Accordion, LinkButton, Link, Button, ButtonGroup, Dropdown, ListGroupItem, \
-    ListGroup, CardHeader, CardFooter, CardBody, Card, Tag, ModalFooter, ModalHeader, ModalBody, Alert
+    ListGroup, CardHeader, CardFooter, CardBody, Card, Tag, ModalFooter, ModalHeader, ModalBody, Alert, \
+    PATH_TO_TEMPLATES, TAG_TEMPLATE_NAME, interned_attribute, SafeHtml, StaticFragment, as_safe_html
+from django_bootstrap_swt.cache import RenderCache
 from django_bootstrap_swt.enums import ProgressColorEnum, BadgeColorEnum, ButtonColorEnum, \
     ButtonSizeEnum, ModalSizeEnum, TextColorEnum, DataToggleEnum, BackgroundColorEnum, BorderColorEnum, \
-    TooltipPlacementEnum, AlertEnum
+    TooltipPlacementEnum, AlertEnum, PrefetchEnum
 
 MSG_TYPE_AFTER_CONCATENATING_WRONG = 'The type after concatenating is not str.'
 MSG_STRING_CONTENT_WRONG_AFTER_CONCATENATING = 'The content of the string is wrong after concatenating.'
@@ -66,6 +71,16 @@ class TestBoostrapComponent(TestCase):
         self.assertEqual(first=self.test_string + self.dummy_content, second=new_string,
                          msg=MSG_STRING_CONTENT_WRONG_AFTER_CONCATENATING)
 
+    def test_rendered_string_concatenates_with_components(self):
+        rendered_string = self.bootstrap_component.render()
+        self.assertEqual(first=self.dummy_content * 2, second=rendered_string + self.bootstrap_component)
+        self.assertEqual(first=self.dummy_content * 2, second=self.bootstrap_component + rendered_string)
+        self.assertEqual(first=self.dummy_content + self.test_string, second=rendered_string + self.test_string)
+        self.assertIsInstance(obj=rendered_string + self.bootstrap_component.render(safe=True), cls=SafeString)
+        self.assertEqual(first=self.dummy_content * 3,
+                         second=rendered_string + self.bootstrap_component + self.bootstrap_component)
+        self.assertEqual(first=self.dummy_content * 2, second=self.bootstrap_component + self.bootstrap_component)
+
     def test_magic_iadd(self):
         new_string = self.test_string
         new_string += self.bootstrap_component
@@ -90,6 +105,171 @@ class TestBoostrapComponent(TestCase):
         self.assertIsInstance(obj=rendered_safe_string, cls=SafeString)
         self.assertEqual(first=self.dummy_content, second=rendered_safe_string)
 
+    def test_as_safe_html_does_not_change_the_safe_string(self):
+        safe_string = SafeString(self.dummy_content)
+        safe_html = as_safe_html(safe_string)
+        self.assertIs(SafeString, type(safe_string))
+        self.assertIs(SafeHtml, type(safe_html))
+        self.assertEqual(first=safe_string, second=safe_html)
+        self.assertIs(safe_html, as_safe_html(safe_html))
+
+    def test_render_returns_safe_html_for_all_components(self):
+        components = [self.bootstrap_component, Badge(content='1234'), Badge(content='1234', tooltip='nice tooltip'),
+                      Modal(btn_content='nice button'), StaticFragment(name='alert_close_button')]
+        for component in components:
+            for safe in [True, False]:
+                self.assertIsInstance(obj=component.render(safe=safe), cls=SafeHtml, msg=type(component).__name__)
+
+
+class TestIterRender(TestCase):
+    """ This class contains all needed tests for testing the streaming render api of the components
+    """
+
+    def test_iter_render_equals_render(self):
+        components = [Accordion(btn_value='nice button', fetch_url='http://example.com'),
+                      ListGroup(items=[ListGroupItem(content='nice item'), ListGroupItem(content='nice item 2')]),
+                      Badge(content='1234', tooltip='nice tooltip'),
+                      Modal(btn_content='nice button', body='nice body'),
+                      BootstrapComponent(path_to_templates='', template_name='dummy.html')]
+        for component in components:
+            self.assertEqual(first=component.render(), second=''.join(component.iter_render()))
+
+    def test_iter_render_yields_children_as_chunks(self):
+        list_group = ListGroup(items=[ListGroupItem(content='nice item'), ListGroupItem(content='nice item 2')])
+        chunks = list(list_group.iter_render())
+        self.assertEqual(first=['<ul class="list-group">',
+                                '<li class="list-group-item">', 'nice item', '</li>',
+                                '<li class="list-group-item">', 'nice item 2', '</li>',
+                                '</ul>'],
+                         second=chunks)
+
+    def test_render_into_equals_render(self):
+        components = [Accordion(btn_value='nice button', fetch_url='http://example.com', header_right_content='right'),
+                      Card(header=CardHeader(content='nice header'), body=CardBody(content='nice body')),
+                      ListGroup(items=[ListGroupItem(content='nice item'), Badge(content='1234', tooltip='tooltip')]),
+                      Modal(btn_content='nice button', body='nice body'),
+                      Alert(msg='nice alert', alert_type=AlertEnum.INFO)]
+        for component in components:
+            buffer = io.StringIO()
+            component.render_into(buffer)
+            self.assertEqual(first=component.render(), second=buffer.getvalue())
+
+    def test_tooltip_is_rendered_in_the_same_pass(self):
+        link = Link(url='/edit/1', content='edit', tooltip='Edit <b>1</b>', tooltip_placement=TooltipPlacementEnum.TOP)
+        inner = Link(url='/edit/1', content='edit').render()
+        expr = Tooltip(title='Edit <b>1</b>', surrounded_component=inner, placement=TooltipPlacementEnum.TOP).render()
+        self.assertEqual(first=expr, second=link.render())
+        self.assertEqual(first=expr, second=''.join(link.iter_render()))
+
+    def assertStreamsRender(self, component):
+        rendered = component.render()
+        buffer = io.StringIO()
+        component.render_into(buffer)
+        self.assertEqual(first=rendered, second=''.join(component.iter_render()))
+        self.assertEqual(first=rendered, second=buffer.getvalue())
+        self.assertEqual(first=1, second=rendered.count('data-toggle="tooltip"'))
+
+    def test_templated_component_with_tooltip_is_wrapped_once(self):
+        self.assertStreamsRender(Dropdown(btn_value='nice dropdown', items=[Link(url='/1', content='nice')],
+                                          tooltip='nice tooltip'))
+
+    def test_cached_component_with_tooltip_is_wrapped_once(self):
+        Badge.render_cache = RenderCache()
+        try:
+            self.assertStreamsRender(Badge(content='1234', tooltip='nice tooltip'))
+        finally:
+            del Badge.render_cache
+
+    def test_nested_tags_are_serialized_into_the_outermost_tag(self):
+        class NotRenderedTag(Tag):
+            __slots__ = ()
+
+            def render(self, safe: bool = False) -> str:
+                raise AssertionError('nested tags are serialized into the chunks of the outermost tag')
+
+        nested = Tag(tag='div', content=[Tag(tag='div', content=[NotRenderedTag(tag='span', content='nice')])])
+        rendered = nested.render()
+        self.assertIsInstance(obj=rendered, cls=SafeHtml)
+        self.assertEqual(first='<div><div><span>nice</span></div></div>', second=rendered)
+
+    def test_render_into_response(self):
+        response = HttpResponse()
+        ListGroup(items=[ListGroupItem(content='nice item')]).render_into(response)
+        self.assertEqual(first=b'<ul class="list-group"><li class="list-group-item">nice item</li></ul>',
+                         second=response.content)
+
+    def test_arender_equals_render(self):
+        list_group = ListGroup(items=[ListGroupItem(content='nice item'),
+                                      Badge(content='1234', tooltip='nice tooltip')])
+        self.assertEqual(first=list_group.render(), second=asyncio.run(list_group.arender()))
+
+
+class TestPrototype(TestCase):
+    """ This class contains all needed tests for testing component prototypes
+    """
+
+    def test_stamp_equals_render(self):
+        prototype = LinkButton.prototype(content='<i class="fas fa-edit"></i>', color=ButtonColorEnum.WARNING)
+        for url, tooltip in [('http://example.com/1?a=1&b="2"', 'Edit <strong>order 1</strong>'),
+                             ('/2', 'Edit \'order\' 2')]:
+            expr = LinkButton(url=url, content='<i class="fas fa-edit"></i>', color=ButtonColorEnum.WARNING,
+                              tooltip=tooltip).render()
+            self.assertEqual(first=expr, second=prototype.stamp(url=url, tooltip=tooltip))
+
+    def test_stamp_does_not_escape_content_slot(self):
+        prototype = Link.prototype(slots=('url', 'content'))
+        self.assertEqual(first=Link(url='/1?a=1&b=2', content='<b>nice</b>').render(),
+                         second=prototype.stamp(url='/1?a=1&b=2', content='<b>nice</b>'))
+
+    def test_stamp_uses_prototype_values_as_defaults(self):
+        prototype = LinkButton.prototype(content='edit', color=ButtonColorEnum.INFO, tooltip='nice tooltip')
+        expr = LinkButton(url='/1', content='edit', color=ButtonColorEnum.INFO, tooltip='nice tooltip').render()
+        self.assertEqual(first=expr, second=prototype.stamp(url='/1'))
+
+    def test_stamp_with_empty_tooltip_has_no_tooltip(self):
+        prototype = LinkButton.prototype(content='edit', color=ButtonColorEnum.INFO, tooltip='nice tooltip')
+        for tooltip in [None, '']:
+            expr = LinkButton(url='/1', content='edit', color=ButtonColorEnum.INFO, tooltip=tooltip).render()
+            self.assertEqual(first=expr, second=prototype.stamp(url='/1', tooltip=tooltip))
+        self.assertNotIn(member='None', container=prototype.stamp(url='/1', tooltip=None))
+        self.assertIn(member='nice tooltip', container=prototype.stamp(url='/2'))
+
+    def test_stamp_without_slot_value(self):
+        prototype = LinkButton.prototype(content='edit', color=ButtonColorEnum.INFO)
+        self.assertRaises(TypeError, prototype.stamp, url='/1')
+
+    def test_prototype_with_unused_slot(self):
+        self.assertRaises(ValueError, Link.prototype, slots=('url', 'open_in_new_tab'), content='nice link')
+
+
+class CustomTemplateComponent(BootstrapComponent):
+    def __init__(self, *args, **kwargs):
+        super(CustomTemplateComponent, self).__init__(path_to_templates='', template_name='dummy.html', *args,
+                                                      **kwargs)
+        self.custom_value = 'custom'
+
+
+class TestSlots(TestCase):
+    """ This class contains all needed tests for testing the slotted components
+    """
+
+    def test_components_have_no_instance_dict(self):
+        components = [Accordion(btn_value='nice button'), Modal(btn_content='nice button'),
+                      Dropdown(btn_value='nice dropdown', items=[Link(url='http://example.com', content='nice')]),
+                      LinkButton(url='http://example.com', content='nice', color=ButtonColorEnum.INFO),
+                      Alert(msg='nice alert', alert_type=AlertEnum.INFO), ProgressBar()]
+        for component in components:
+            self.assertFalse(hasattr(component, '__dict__'), msg=type(component).__name__)
+
+    def test_context_is_minimal(self):
+        context = Tag(tag='div', content='nice', needs_perm='some_perm').get_context()
+        self.assertEqual(first={'tag': 'div', 'content': 'nice', 'attrs': {}}, second=context)
+
+    def test_context_of_subclass_without_slots(self):
+        component = CustomTemplateComponent()
+        self.assertEqual(first={'custom_value': 'custom'}, second=component.get_context())
+        self.assertEqual(first='dummy template contents', second=component.render())
+
 
 class TestInheritance(TestCase):
     """ This class contains all needed tests for testing inheritance of super classes.
@@ -233,6 +413,14 @@ class TestModal(StringDiffTestCase):
     """ This class contains all needed tests for testing Modal class
     """
 
+    def test_rendering_with_prefetch(self):
+        first = Modal(btn_content='nice button', fetch_url='http://example.com', prefetch=PrefetchEnum.HOVER)
+        self.assertIn(member=' data-url="http://example.com" data-prefetch="hover"', container=first.render())
+
+    def test_rendering_with_cache_ttl(self):
+        first = Modal(btn_content='nice button', fetch_url='http://example.com', cache_ttl=3000)
+        self.assertIn(member=' data-url="http://example.com" data-cache-ttl="3000"', container=first.render())
+
     def test_rendering_with_modal_header_str_argument(self):
         first = Modal(title='nice modal', btn_content='nice button',
                       btn_attrs={"class": [ButtonColorEnum.SUCCESS.value]}, header='nice header')
@@ -390,6 +578,11 @@ class TestCardBody(StringDiffTestCase):
     """ This class contains all needed tests for testing CardBody class
     """
 
+    def test_rendering_with_cache_ttl(self):
+        first = CardBody(content='nice body', fetch_url='http://example.com', cache_ttl=3000)
+        self.assertIn(member=' data-url="http://example.com" data-cache-ttl="3000"', container=first.render())
+        self.assertNotIn(member='data-cache-ttl', container=CardBody(content='nice body', cache_ttl=3000).render())
+
     def test_rendering_with_body_id(self):
         body_id = uuid.uuid4()
         first = CardBody(content='nice body', body_id=body_id)
@@ -480,6 +673,14 @@ class TestAccordion(StringDiffTestCase):
     """ This class contains all needed tests for testing Accordion class
     """
 
+    def test_rendering_with_prefetch(self):
+        first = Accordion(btn_value='nice button', fetch_url='http://example.com', prefetch=PrefetchEnum.IDLE)
+        self.assertIn(member=' data-url="http://example.com" data-prefetch="idle"', container=first.render())
+
+    def test_rendering_with_cache_ttl(self):
+        first = Accordion(btn_value='nice button', fetch_url='http://example.com', cache_ttl=60)
+        self.assertIn(member=' data-url="http://example.com" data-cache-ttl="60"', container=first.render())
+
     def setUp(self) -> None:
         super(TestAccordion, self).setUp()
         self.header = CardHeader(content='nice header')
@@ -580,6 +781,12 @@ class TestListGroup(StringDiffTestCase):
         expr = render_to_string(template_name='components/listgroup/test_listgroup.html')
         self.assertMultiLineEqual(first=first.render(safe=True), second=expr, msg=MSG_RENDERED_TEMPLATE_IS_NOT_CORRECT)
 
+    def test_items_are_rendered_lazy(self):
+        item = ListGroupItem(content='nice item')
+        first = ListGroup(items=[item, ])
+        item.update_attribute('class', ['active'])
+        self.assertIn(member='<li class="list-group-item active">nice item</li>', container=first.render())
+
 
 class TestTooltip(StringDiffTestCase):
     """ This class contains all needed tests for testing Tooltip class
@@ -614,6 +821,12 @@ class TestTag(StringDiffTestCase):
         self.assertEqual(tag.attrs, {'class': ['class-1', 'class-2'],
                                      'new_attr': ['value-1']})
 
+    def test_with_attributes_does_not_change_the_tag(self):
+        tag = Tag(tag='a', attrs={'class': ['class-1', 'class-2'], 'href': ['/']})
+        updated = tag.with_attributes(update_attrs={'class': ['class-3', 'class-2']}, href='/edit')
+        self.assertEqual(updated.attrs, {'class': ['class-1', 'class-2', 'class-3'], 'href': ['/edit']})
+        self.assertEqual(tag.attrs, {'class': ['class-1', 'class-2'], 'href': ['/']})
+
     def test_rendering_of_icon(self):
         first = Tag(tag='i', attrs={'class': ['fab', 'fa-accessible-icon']})
         expr = render_to_string(template_name='components/tag/test_tag_icon.html')
@@ -623,3 +836,29 @@ class TestTag(StringDiffTestCase):
         first = Tag(tag='i', attrs={'class': ['fab', 'fa-accessible-icon'], 'disabled': {}})
         expr = render_to_string(template_name='components/tag/test_tag_icon_disabled.html')
         self.assertMultiLineEqual(first=first.render(safe=True), second=expr, msg=MSG_RENDERED_TEMPLATE_IS_NOT_CORRECT)
+
+    def test_serialize_equals_template_rendering(self):
+        tags = [Tag(tag='i', attrs={'class': ['fab', 'fa-accessible-icon'], 'disabled': {}}),
+                Tag(tag='span', attrs={'title': ['<b>"quoted" & \'single\'</b>'], 'tabindex': [0]},
+                    content='<strong>content</strong>'),
+                Tag(tag='div', attrs={'data-none': [None], 'data-safe': [SafeString('<b>')]}, content=0),
+                Tag(tag='div', content=Tag(tag='span', content='nested')),
+                Tag(tag='a', attrs={'class': ['btn', '"><script>'], 'role': [SafeString('<b>'), 'button'],
+                                    'type': [1]})]
+        for tag in tags:
+            expr = render_to_string(template_name=PATH_TO_TEMPLATES + TAG_TEMPLATE_NAME, context=tag.get_context())
+            self.assertMultiLineEqual(first=tag.render(safe=True), second=expr,
+                                      msg=MSG_RENDERED_TEMPLATE_IS_NOT_CORRECT)
+
+    def test_enum_driven_attributes_are_interned(self):
+        first = LinkButton(url='/edit/1', content='edit', color=ButtonColorEnum.WARNING).start_tag()
+        second = LinkButton(url='/edit/2', content='edit', color=ButtonColorEnum.WARNING).start_tag()
+        self.assertIn(member=' class="btn btn-warning"', container=first)
+        self.assertIs(interned_attribute('class', ('btn', 'btn-warning')),
+                      interned_attribute('class', ('btn', 'btn-warning')))
+        self.assertNotEqual(first=first, second=second)
+
+    def test_rendering_with_custom_template(self):
+        tag = Tag(tag='div', path_to_templates='', template_name='dummy.html')
+        self.assertFalse(tag.uses_default_template())
+        self.assertEqual(first='dummy template contents', second=tag.render())
@@ -0,0 +1,58 @@
+from pathlib import Path
+from unittest import TestCase
+from django.test import override_settings
+from django.utils.autoreload import file_changed
+from django.utils.safestring import SafeString
+from django.utils.translation import override
+from django_bootstrap_swt import fragments
+from django_bootstrap_swt.components import StaticFragment, Accordion, Modal, SafeHtml
+
+
+class TestStaticFragments(TestCase):
+    """ This class contains all needed tests for testing the static fragments registry
+    """
+
+    def setUp(self) -> None:
+        self.builds = []
+        fragments.register_fragment('test_fragment', self.build)
+
+    def build(self):
+        self.builds.append(1)
+        return SafeString(f'<b>{len(self.builds)}</b>')
+
+    def test_fragment_is_rendered_once_per_language(self):
+        with override('en'):
+            self.assertEqual(first='<b>1</b>', second=fragments.get_fragment('test_fragment'))
+            self.assertEqual(first='<b>1</b>', second=fragments.get_fragment('test_fragment'))
+        with override('de'):
+            self.assertEqual(first='<b>2</b>', second=fragments.get_fragment('test_fragment'))
+        with override('en'):
+            self.assertEqual(first='<b>1</b>', second=StaticFragment(name='test_fragment').render())
+
+    def test_fragments_are_cleared_on_file_change(self):
+        fragments.get_fragment('test_fragment')
+        file_changed.send(sender=None, file_path=Path('ajax_error.html'))
+        self.assertEqual(first='<b>2</b>', second=fragments.get_fragment('test_fragment'))
+
+    def test_fragments_are_cleared_on_language_setting_change(self):
+        fragments.get_fragment('test_fragment')
+        with override_settings(LANGUAGE_CODE='de'):
+            self.assertEqual(first='<b>2</b>', second=fragments.get_fragment('test_fragment'))
+
+    def test_render_does_not_change_the_memoized_fragment(self):
+        fragment = fragments.get_fragment('test_fragment')
+        for safe in [True, False]:
+            rendered = StaticFragment(name='test_fragment').render(safe=safe)
+            self.assertIsInstance(rendered, SafeHtml)
+            self.assertEqual(first=fragment, second=rendered)
+        self.assertIs(SafeString, type(fragment))
+
+    def test_render_returns_memoized_safe_html(self):
+        spinner = fragments.get_fragment('ajax_loading_spinner')
+        self.assertIs(SafeHtml, type(spinner))
+        self.assertIs(spinner, StaticFragment(name='ajax_loading_spinner').render())
+
+    def test_components_share_the_fragments(self):
+        spinner = fragments.get_fragment('ajax_loading_spinner')
+        self.assertIn(member=spinner, container=Accordion(btn_value='nice button', fetch_url='/details').render())
+        self.assertIn(member=spinner, container=Modal(btn_content='nice button', fetch_url='/details').render())
@@ -0,0 +1,69 @@
+from unittest import TestCase
+from django.http import HttpResponse
+from django.test import RequestFactory, override_settings
+from django_bootstrap_swt.components import Button, Accordion
+from django_bootstrap_swt.ids import CounterIdFactory, generate_id, id_factory, id_namespace, get_id_factory, \
+    uuid_id_factory
+from django_bootstrap_swt.middleware import IdFactoryMiddleware
+
+
+def static_id_factory():
+    return 'static'
+
+
+class TestIdFactory(TestCase):
+    """ This class contains all needed tests for testing the id factories
+    """
+
+    def test_default_factory_is_uuid(self):
+        self.assertIs(get_id_factory(), uuid_id_factory)
+        self.assertNotEqual(first=generate_id(), second=generate_id())
+
+    def test_counter_factory(self):
+        factory = CounterIdFactory()
+        self.assertEqual(first=['1', '2'], second=[factory(), factory()])
+
+    def test_counter_factory_with_namespace(self):
+        factory = CounterIdFactory(namespace='fragment')
+        self.assertEqual(first=['fragment-1', 'fragment-2'], second=[factory(), factory()])
+
+    def test_id_namespace_is_used_by_components(self):
+        with id_namespace(namespace='ns'):
+            accordion = Accordion(btn_value='nice button')
+            button = Button(content='nice button')
+        self.assertEqual(first='id_ns-1', second=accordion.accordion_id)
+        self.assertEqual(first='id_ns-5', second=button.button_id)
+        self.assertIs(get_id_factory(), uuid_id_factory)
+
+    def test_id_namespace_renders_deterministic(self):
+        with id_namespace():
+            first = Accordion(btn_value='nice button').render()
+        with id_namespace():
+            second = Accordion(btn_value='nice button').render()
+        self.assertEqual(first=first, second=second)
+
+    def test_id_factory_context(self):
+        with id_factory(static_id_factory):
+            self.assertEqual(first='id_static', second=generate_id())
+
+    @override_settings(BOOTSTRAP_SWT_ID_FACTORY='tests.test_ids.static_id_factory')
+    def test_id_factory_setting(self):
+        self.assertEqual(first='id_static', second=Button(content='nice button').button_id)
+
+
+class TestIdFactoryMiddleware(TestCase):
+    """ This class contains all needed tests for testing IdFactoryMiddleware class
+    """
+
+    @staticmethod
+    def view(request):
+        return HttpResponse(Button(content='nice button').button_id)
+
+    def test_ids_are_stable_per_path(self):
+        middleware = IdFactoryMiddleware(get_response=self.view)
+        first = middleware(RequestFactory().get('/orders/')).content
+        second = middleware(RequestFactory().get('/orders/')).content
+        fragment = middleware(RequestFactory().get('/orders/1/details/')).content
+        self.assertEqual(first=first, second=second)
+        self.assertNotEqual(first=first, second=fragment)
+        self.assertTrue(first.endswith(b'-1'))
@@ -0,0 +1,64 @@
+from unittest import TestCase
+from django.http import HttpResponse
+from django.test import RequestFactory
+from django_bootstrap_swt.components import Badge, ListGroup, ListGroupItem, Modal, BootstrapComponent
+from django_bootstrap_swt.instrumentation import collect_render_stats, get_render_stats
+from django_bootstrap_swt.middleware import RenderStatsMiddleware
+
+
+class TestRenderStats(TestCase):
+    """ This class contains all needed tests for testing the render instrumentation
+    """
+
+    def test_no_stats_outside_of_context(self):
+        self.assertIsNone(get_render_stats())
+        with collect_render_stats() as stats:
+            self.assertIs(get_render_stats(), stats)
+        self.assertIsNone(get_render_stats())
+
+    def test_renders_are_counted_per_class(self):
+        with collect_render_stats() as stats:
+            rendered = ListGroup(items=[ListGroupItem(content='item 1'), ListGroupItem(content='item 2')]).render()
+        self.assertEqual(first=1, second=stats.components['ListGroup'].renders)
+        self.assertEqual(first=2, second=stats.components['ListGroupItem'].renders)
+        self.assertEqual(first=len(rendered), second=stats.components['ListGroup'].bytes)
+        self.assertEqual(first=3, second=stats.renders)
+        self.assertAlmostEqual(first=stats.components['ListGroup'].duration, second=stats.duration)
+
+    def test_super_render_is_not_counted_twice(self):
+        with collect_render_stats() as stats:
+            Badge(content='1234', tooltip='nice tooltip').render()
+        self.assertEqual(first=1, second=stats.components['Badge'].renders)
+        # the tooltip is serialized in the same pass as the badge
+        self.assertNotIn(member='Tooltip', container=stats.components)
+
+    def test_template_lookups_are_counted(self):
+        with collect_render_stats() as stats:
+            Modal(btn_content='nice button', fetch_url='http://example.com').render()
+            BootstrapComponent(path_to_templates='', template_name='dummy.html').render()
+        self.assertEqual(first=1, second=stats.components['Modal'].template_lookups)
+        self.assertEqual(first=2, second=stats.template_lookups)
+
+    def test_server_timing(self):
+        with collect_render_stats() as stats:
+            Badge(content='1234').render()
+        server_timing = stats.server_timing()
+        self.assertTrue(server_timing.startswith('swt;dur='))
+        self.assertIn(member='swt-Badge;dur=', container=server_timing)
+
+
+class TestRenderStatsMiddleware(TestCase):
+    """ This class contains all needed tests for testing RenderStatsMiddleware class
+    """
+
+    @staticmethod
+    def view(request):
+        response = HttpResponse(Badge(content='1234').render())
+        response['Server-Timing'] = 'db;dur=1'
+        return response
+
+    def test_server_timing_header(self):
+        request = RequestFactory().get('/')
+        response = RenderStatsMiddleware(get_response=self.view)(request)
+        self.assertTrue(response['Server-Timing'].startswith('db;dur=1, swt;dur='))
+        self.assertEqual(first=1, second=request.swt_render_stats.components['Badge'].renders)
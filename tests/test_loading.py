@@ -0,0 +1,39 @@
+from unittest import TestCase
+from unittest.mock import patch
+from django.template.engine import Engine
+from django.test import override_settings
+from django.utils.autoreload import file_changed
+from django_bootstrap_swt import loading
+from django_bootstrap_swt.components import Modal, Dropdown, Link
+
+
+class TestTemplatePinning(TestCase):
+    """ This class contains all needed tests for testing the template warm up and pinning
+    """
+
+    def setUp(self) -> None:
+        loading.clear_component_templates()
+
+    def test_warm_up_templates(self):
+        template_names = loading.warm_up_templates()
+        self.assertIn(member='django_bootstrap_swt/components/modal.html', container=template_names)
+        self.assertIn(member='django_bootstrap_swt/includes/ajax_loading_spinner.html', container=template_names)
+        self.assertEqual(first=set(template_names), second=set(loading._templates))
+
+    def test_pinned_template_is_not_searched_again(self):
+        loading.warm_up_templates()
+        with patch.object(Engine, 'find_template', side_effect=AssertionError('template searched')):
+            Dropdown(btn_value='nice dropdown', items=[Link(url='/', content='item')]).render()
+
+    def test_pinned_templates_are_cleared_on_file_change(self):
+        loading.warm_up_templates()
+        file_changed.send(sender=None, file_path=loading.TEMPLATE_ROOT / 'dummy.html')
+        self.assertEqual(first={}, second=loading._templates)
+
+    def test_pinned_templates_are_cleared_on_templates_setting_change(self):
+        loading.warm_up_templates()
+        with override_settings(TEMPLATES=[{"BACKEND": "django.template.backends.django.DjangoTemplates",
+                                           "APP_DIRS": True}]):
+            self.assertEqual(first={}, second=loading._templates)
+            Modal(btn_content='nice button').render()
+        self.assertEqual(first={}, second=loading._templates)
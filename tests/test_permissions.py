@@ -0,0 +1,35 @@
+from unittest import TestCase
+from django_bootstrap_swt.permissions import AnyOf, AllOf, PermissionExpression, check_permission
+
+USER_PERMISSIONS = frozenset(['some_perm', 'some_perm2'])
+
+
+class TestPermissionExpressions(TestCase):
+    """ This class contains all needed tests for testing the permission expressions
+    """
+
+    def test_any_of(self):
+        self.assertTrue(AnyOf('some_perm', 'some_perm3')(USER_PERMISSIONS))
+        self.assertFalse(AnyOf('some_perm3', 'some_perm4')(USER_PERMISSIONS))
+
+    def test_all_of(self):
+        self.assertTrue(AllOf('some_perm', 'some_perm2')(USER_PERMISSIONS))
+        self.assertFalse(AllOf('some_perm', 'some_perm3')(USER_PERMISSIONS))
+
+    def test_nested_expressions(self):
+        self.assertTrue(AllOf('some_perm', AnyOf('some_perm2', 'some_perm3'))(USER_PERMISSIONS))
+        self.assertFalse(AnyOf('some_perm3', AllOf('some_perm', 'some_perm4'))(USER_PERMISSIONS))
+
+    def test_expressions_are_hashable(self):
+        self.assertEqual(first=AnyOf('a', 'b'), second=AnyOf('b', 'a'))
+        self.assertEqual(first=hash(AnyOf('a', 'b')), second=hash(AnyOf('b', 'a')))
+        self.assertNotEqual(first=AnyOf('a', 'b'), second=AllOf('a', 'b'))
+
+    def test_base_expression_is_abstract(self):
+        self.assertRaises(TypeError, PermissionExpression, 'some_perm')
+
+    def test_check_permission(self):
+        self.assertTrue(check_permission('some_perm', USER_PERMISSIONS))
+        self.assertFalse(check_permission(['some_perm', 'some_perm3'], USER_PERMISSIONS))
+        self.assertTrue(check_permission(lambda user_permissions: 'some_perm2' in user_permissions,
+                                         USER_PERMISSIONS))
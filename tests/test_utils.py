@@ -1,6 +1,21 @@
+import asyncio
 from unittest import TestCase
-from django_bootstrap_swt.components import Link, Badge
-from django_bootstrap_swt.utils import RenderHelper
+from django.http import HttpResponse
+from django.test import RequestFactory
+from django_bootstrap_swt.components import Link, Badge, Modal
+from django_bootstrap_swt.context_processors import render_helper as render_helper_context_processor
+from django_bootstrap_swt.middleware import RenderHelperMiddleware
+from django_bootstrap_swt.permissions import AnyOf
+from django_bootstrap_swt.utils import RenderHelper, get_render_helper
+
+
+class DummyUser:
+    def __init__(self):
+        self.get_all_permissions_calls = 0
+
+    def get_all_permissions(self):
+        self.get_all_permissions_calls += 1
+        return {'orders.change_order', 'orders.view_order'}
 
 
 class TestRenderHelper(TestCase):
@@ -50,6 +65,41 @@ class TestRenderHelper(TestCase):
             item=Badge(content='1234'))
         self.assertTrue(has_perm)
 
+    def test__check_render_permission_expression(self):
+        render_helper = RenderHelper(user_permissions=['some_perm', 'some_perm2'])
+        self.assertTrue(render_helper._check_render_permission(
+            item=Badge(content='1234', needs_perm=AnyOf('some_perm3', 'some_perm'))))
+        self.assertFalse(render_helper._check_render_permission(
+            item=Badge(content='1234', needs_perm=['some_perm', 'some_perm3'])))
+
+    def test__check_render_permission_unhashable_requirement(self):
+        render_helper = RenderHelper(user_permissions=['some_perm'])
+        self.assertTrue(render_helper._check_render_permission(item=Badge(content='1234', needs_perm=[['some_perm']])))
+        self.assertFalse(render_helper._check_render_permission(
+            item=Badge(content='1234', needs_perm=[['some_perm', 'some_perm3']])))
+
+    def test__check_render_permission_uses_changed_user_permissions(self):
+        render_helper = RenderHelper(user_permissions=['some_perm'])
+        item = Badge(content='1234', needs_perm='some_perm2')
+        self.assertFalse(render_helper._check_render_permission(item=item))
+        render_helper.user_permissions.append('some_perm2')
+        self.assertTrue(render_helper._check_render_permission(item=item))
+        render_helper.user_permissions = ['some_perm']
+        self.assertFalse(render_helper._check_render_permission(item=item))
+
+    def test__check_render_permission_is_evaluated_once_per_requirement(self):
+        calls = []
+
+        def needs_perm(user_permissions):
+            calls.append(user_permissions)
+            return True
+
+        render_helper = RenderHelper(user_permissions=['some_perm'])
+        rendered_list = render_helper.render_list_coherent(items=[Badge(content='1', needs_perm=needs_perm),
+                                                                  Badge(content='2', needs_perm=needs_perm)])
+        self.assertEqual(first=Badge(content='1').render() + Badge(content='2').render(), second=rendered_list)
+        self.assertEqual(first=[frozenset(['some_perm'])], second=calls)
+
     def test_render_item_no_attribute_needs_perm(self):
         render_helper = RenderHelper(user_permissions=['some_perm', 'some_perm2'])
         rendered_item = render_helper.render_item(item=Badge(content='1234'))
@@ -72,6 +122,14 @@ class TestRenderHelper(TestCase):
         expr = Badge(content='').render()
         self.assertEqual(first=rendered_list, second=expr)
 
+    def test_iter_list(self):
+        render_helper = RenderHelper(user_permissions=['some_perm', 'some_perm2'])
+        items = [Badge(content='1', needs_perm='some_perm3'), Badge(content='2', needs_perm='some_perm'),
+                 Link(url='http://example.com', content='3')]
+        chunks = render_helper.iter_list(items=items)
+        expr = Badge(content='2').render() + Link(url='http://example.com', content='3').render()
+        self.assertEqual(first=''.join(chunks), second=expr)
+
     def test_render_item_with_update_url_qs_url_has_key(self):
         url_before_update = 'http://example.com?key=xxx'
         url_after_update = 'http://example.com?key=content'
@@ -102,6 +160,42 @@ class TestRenderHelper(TestCase):
 
         self.assertEqual(first=rendered_item, second=test_link_rendered)
 
+    def test_update_queryparams_keeps_multi_valued_params(self):
+        render_helper = RenderHelper(update_url_qs={'key': 'content', 'tags': ['a', 'b']})
+        link = render_helper.update_queryparams(item=Link(content='1234',
+                                                          url='/list?id=1&key=xxx&id=2&key=yyy#top'))
+        self.assertEqual(first=['/list?id=1&key=content&id=2&tags=a&tags=b#top'], second=link.attrs['href'])
+
+    def test_update_queryparams_is_memoized(self):
+        render_helper = RenderHelper(update_url_qs={'key': 'content'})
+        hrefs = [render_helper.update_queryparams(item=Link(content='1234', url='http://example.com?key=xxx'))
+                 .attrs['href'][0] for _ in range(3)]
+        self.assertEqual(first=['http://example.com?key=content'] * 3, second=hrefs)
+        self.assertIs(hrefs[0], hrefs[2])
+        self.assertEqual(first=1, second=len(render_helper._href_cache))
+
+    def test_update_queryparams_memoizes_bounded_number_of_hrefs(self):
+        render_helper = RenderHelper(update_url_qs={'key': 'content'})
+        render_helper.HREF_CACHE_SIZE = 2
+        for url in ['/1', '/2', '/1', '/3']:
+            render_helper.update_queryparams(item=Link(content='1234', url=url))
+        self.assertEqual(first=['/1', '/3'], second=list(render_helper._href_cache))
+
+    def test_update_queryparams_uses_changed_update_url_qs(self):
+        render_helper = RenderHelper(update_url_qs={'key': 'content'})
+        render_helper.update_queryparams(item=Link(content='1234', url='/list'))
+        render_helper.update_url_qs = {'key': 'other'}
+        link = render_helper.update_queryparams(item=Link(content='1234', url='/list'))
+        self.assertEqual(first=['/list?key=other'], second=link.attrs['href'])
+        render_helper.update_url_qs['page'] = 2
+        link = render_helper.update_queryparams(item=Link(content='1234', url='/list'))
+        self.assertEqual(first=['/list?key=other&page=2'], second=link.attrs['href'])
+
+    def test_update_queryparams_without_params_has_no_question_mark(self):
+        render_helper = RenderHelper(update_url_qs={})
+        link = render_helper.update_queryparams(item=Link(content='1234', url='/list?#top'))
+        self.assertEqual(first=['/list#top'], second=link.attrs['href'])
+
     def test_render_item_with_update_attrs(self):
         test_link_rendered = Link(content='1234', url="http://example.com")
         test_link_rendered.update_attribute('key', ['value-1', 'value-2'])
@@ -109,3 +203,87 @@ class TestRenderHelper(TestCase):
         rendered_item = render_helper.render_item(item=Link(content="1234", url="http://example.com"))
 
         self.assertMultiLineEqual(first=rendered_item, second=test_link_rendered.render())
+
+    def test_render_item_does_not_change_the_item(self):
+        link = Link(content='1234', url='http://example.com?key=xxx')
+        link.update_attribute('class', ['class-1'])
+        render_helper = RenderHelper(update_url_qs={'key': 'content'}, update_attrs={'class': ['class-2']})
+        first = render_helper.render_item(item=link)
+        second = render_helper.render_item(item=link)
+
+        self.assertEqual(first=first, second=second)
+        self.assertIn(member='class-2', container=first)
+        self.assertEqual(first=['http://example.com?key=xxx'], second=link.attrs['href'])
+        self.assertEqual(first=['class-1'], second=link.attrs['class'])
+
+    def test_render_item_does_not_change_the_modal_button(self):
+        modal = Modal(btn_content='nice button', fetch_url='http://example.com')
+        button_attrs = {attribute: list(values) for attribute, values in modal.button.attrs.items()}
+        render_helper = RenderHelper(update_attrs={'class': ['btn-sm']})
+        rendered_item = render_helper.render_item(item=modal)
+
+        self.assertIn(member='btn-sm', container=rendered_item)
+        self.assertEqual(first=button_attrs, second=modal.button.attrs)
+
+    def test_arender_item(self):
+        render_helper = RenderHelper(user_permissions=['some_perm'])
+        self.assertEqual(first=Badge(content='1').render(),
+                         second=asyncio.run(render_helper.arender_item(item=Badge(content='1',
+                                                                                  needs_perm='some_perm'))))
+        self.assertEqual(first='', second=asyncio.run(render_helper.arender_item(item=Badge(content='1',
+                                                                                          needs_perm='other_perm'))))
+
+    def test_arender_list(self):
+        render_helper = RenderHelper(user_permissions=['some_perm'])
+        items = [Badge(content=str(i), needs_perm='some_perm' if i % 2 else 'other_perm') for i in range(5)]
+        self.assertEqual(first=render_helper.render_list_coherent(items=items),
+                         second=asyncio.run(render_helper.arender_list(items=items)))
+
+    def test_aiter_list_renders_in_batches(self):
+        render_helper = RenderHelper(user_permissions=['some_perm'])
+        items = [Badge(content=str(i), needs_perm='some_perm') for i in range(5)]
+
+        async def consume():
+            return [chunk async for chunk in render_helper.aiter_list(items=(item for item in items), batch_size=2)]
+
+        chunks = asyncio.run(consume())
+        self.assertEqual(first=3, second=len(chunks))
+        self.assertEqual(first=render_helper.render_list_coherent(items=items), second=''.join(chunks))
+
+
+class TestRequestRenderHelper(TestCase):
+    """ This class contains all needed tests for testing the request scoped RenderHelper
+    """
+
+    def setUp(self) -> None:
+        self.request = RequestFactory().get('/')
+        self.request.user = DummyUser()
+
+    def test_from_user(self):
+        render_helper = RenderHelper.from_user(DummyUser(), update_url_qs={'key': 'value'})
+        self.assertTrue(render_helper._check_render_permission(item=Badge(content='1', needs_perm='change_order')))
+        self.assertTrue(render_helper._check_render_permission(item=Badge(content='1',
+                                                                          needs_perm='orders.view_order')))
+        self.assertFalse(render_helper._check_render_permission(item=Badge(content='1', needs_perm='delete_order')))
+        self.assertEqual(first={'key': 'value'}, second=render_helper.update_url_qs)
+
+    def test_get_render_helper_is_built_once_per_request(self):
+        self.assertIs(get_render_helper(self.request), get_render_helper(self.request))
+        self.assertEqual(first=1, second=self.request.user.get_all_permissions_calls)
+
+    def test_middleware_and_context_processor_share_the_render_helper(self):
+        def view(request):
+            context = render_helper_context_processor(request)
+            rendered = request.render_helper.render_item(item=Badge(content='1', needs_perm='change_order'))
+            rendered += context['render_helper'].render_item(item=Badge(content='2', needs_perm='view_order'))
+            return HttpResponse(rendered)
+
+        response = RenderHelperMiddleware(get_response=view)(self.request)
+        self.assertEqual(first=(Badge(content='1').render() + Badge(content='2').render()).encode(),
+                         second=response.content)
+        self.assertEqual(first=1, second=self.request.user.get_all_permissions_calls)
+
+    def test_render_helper_is_built_lazy(self):
+        RenderHelperMiddleware(get_response=lambda request: HttpResponse())(self.request)
+        render_helper_context_processor(self.request)
+        self.assertEqual(first=0, second=self.request.user.get_all_permissions_calls)
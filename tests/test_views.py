@@ -0,0 +1,89 @@
+from datetime import datetime
+from unittest import TestCase
+from django.core.cache import cache
+from django.http import Http404
+from django.test import RequestFactory
+from django.utils.http import http_date
+from django_bootstrap_swt.components import ModalBody
+from django_bootstrap_swt.views import register_fetch_fragment, fetch_fragment_view, fetch_fragment_url
+
+LAST_MODIFIED = datetime(2020, 12, 1, 12, 0, 0)
+RENDERS = []
+
+
+@register_fetch_fragment('order-details')
+def order_details(request):
+    RENDERS.append(request)
+    return ModalBody(content=f"order {request.GET['pk']}")
+
+
+@register_fetch_fragment('public-order-details', vary_on_user=False)
+def public_order_details(request):
+    return f"order {request.GET['pk']}"
+
+
+@register_fetch_fragment('cached-order-details', last_modified=lambda request: LAST_MODIFIED, cache_timeout=60)
+def cached_order_details(request):
+    RENDERS.append(request)
+    return f"order {request.GET['pk']}"
+
+
+class TestFetchFragmentView(TestCase):
+    """ This class contains all needed tests for testing the fetch fragment view
+    """
+
+    def setUp(self) -> None:
+        self.factory = RequestFactory()
+        RENDERS.clear()
+        cache.clear()
+
+    def get(self, name: str, **headers):
+        return fetch_fragment_view(self.factory.get(fetch_fragment_url(name, pk=1), **headers), name=name)
+
+    def test_fetch_fragment_url(self):
+        self.assertEqual(first='/swt/fragments/order-details/?pk=1', second=fetch_fragment_url('order-details', pk=1))
+
+    def test_fragment_is_rendered_with_etag(self):
+        response = self.get('order-details')
+        self.assertEqual(first=200, second=response.status_code)
+        self.assertEqual(first=ModalBody(content='order 1').render().encode('utf-8'), second=response.content)
+        self.assertTrue(response['ETag'].startswith('"'))
+        self.assertIn(member='no-cache', container=response['Cache-Control'])
+
+    def test_cache_control_header(self):
+        self.assertEqual(first='no-cache, private', second=self.get('order-details')['Cache-Control'])
+        self.assertEqual(first='no-cache', second=self.get('public-order-details')['Cache-Control'])
+
+    def test_matching_etag_is_answered_with_304(self):
+        etag = self.get('order-details')['ETag']
+        response = self.get('order-details', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(first=304, second=response.status_code)
+        self.assertEqual(first=etag, second=response['ETag'])
+
+    def test_not_modified_since_is_answered_without_rendering(self):
+        response = self.get('cached-order-details', HTTP_IF_MODIFIED_SINCE=http_date(LAST_MODIFIED.timestamp() + 60))
+        self.assertEqual(first=304, second=response.status_code)
+        self.assertEqual(first=[], second=RENDERS)
+
+    def test_not_modified_since_is_answered_with_cached_etag(self):
+        etag = self.get('cached-order-details')['ETag']
+        response = self.get('cached-order-details', HTTP_IF_MODIFIED_SINCE=http_date(LAST_MODIFIED.timestamp() + 60))
+        self.assertEqual(first=304, second=response.status_code)
+        self.assertEqual(first=etag, second=response['ETag'])
+        self.assertEqual(first=1, second=len(RENDERS))
+
+    def test_fragment_is_cached_on_the_server(self):
+        first = self.get('cached-order-details')
+        second = self.get('cached-order-details')
+        self.assertEqual(first=1, second=len(RENDERS))
+        self.assertEqual(first=first.content, second=second.content)
+        self.assertEqual(first=first['ETag'], second=second['ETag'])
+        self.assertEqual(first='Tue, 01 Dec 2020 12:00:00 GMT', second=first['Last-Modified'])
+
+    def test_unknown_fragment(self):
+        with self.assertRaises(Http404):
+            fetch_fragment_view(self.factory.get('/'), name='unknown')
+
+    def test_post_is_not_allowed(self):
+        response = fetch_fragment_view(self.factory.post('/'), name='order-details')
+        self.assertEqual(first=405, second=response.status_code)